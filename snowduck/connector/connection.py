@@ -35,7 +35,7 @@ class Connection:
         self._role: str | None = None
         self._warehouse: str | None = None
         self._session_variables: dict[
-            str, str
+            str, exp.Literal | str
         ] = {}  # Session variables (SET var = value)
 
         if database:
@@ -131,6 +131,16 @@ class Connection:
             table=table,
         )
 
+    def get_column_metadata_map(self, table: str) -> dict[str, dict[str, Any]]:
+        """Return get_column_metadata keyed by column name."""
+        if not self._database or not self._schema:
+            return {}
+        return self._info_schema_manager.get_table_column_map(
+            database=self._database,
+            schema=self._schema,
+            table=table,
+        )
+
     def rollback(self) -> None:
         self.cursor().execute("ROLLBACK")
 
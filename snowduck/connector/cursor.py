@@ -458,6 +458,11 @@ class Cursor:
                 msg=e.args[0], errno=1003, sqlstate="42000"
             ) from None
 
+        if cmd.startswith(("CREATE", "ALTER", "DROP", "DETACH")):
+            # The info schema manager caches which databases/schemas exist
+            # and the columns of each table
+            self._info_schema_manager.clear_cache()
+
         affected_count = None
 
         # Generate results for specific commands
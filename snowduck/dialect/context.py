@@ -1,5 +1,7 @@
 from dataclasses import dataclass, field
 
+from sqlglot import exp
+
 from ..info_schema import InfoSchemaManager
 
 
@@ -10,5 +12,19 @@ class DialectContext:
     current_role: str | None = None
     current_warehouse: str | None = None
     info_schema_manager: InfoSchemaManager
-    # Session variables (SET var = value)
-    session_variables: dict[str, str] = field(default_factory=dict)
+    # Session variables (SET var = value), stored as the literal substituted
+    # for $var; plain string values are coerced on use
+    session_variables: dict[str, exp.Literal | str] = field(default_factory=dict)
+    # Upper-cased current_schema, kept in sync on assignment so per-node
+    # preprocessing can compare it without re-upper-casing.
+    current_schema_upper: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        if name == "current_schema":
+            super().__setattr__(
+                "current_schema_upper",
+                value.upper() if isinstance(value, str) and value else None,
+            )
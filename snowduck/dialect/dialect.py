@@ -6,16 +6,12 @@ from sqlglot.dialects import DuckDB
 from .context import DialectContext
 from .preprocess import (
     preprocess_bitwise,
-    preprocess_current_schema,
     preprocess_date_functions,
+    preprocess_fused,
     preprocess_generator,
-    preprocess_identifier,
-    preprocess_info_schema,
     preprocess_regexp_replace,
-    preprocess_semi_structured,
     preprocess_seq_functions,
     preprocess_special_expressions,
-    preprocess_system_calls,
     preprocess_variables,
 )
 from .transforms import (
@@ -119,21 +115,9 @@ class Dialect(DuckDB):
             expression = expression.transform(
                 preprocess_variables, context=self._context
             )
-            expression = expression.transform(
-                preprocess_identifier, context=self._context
-            )
-            expression = expression.transform(
-                preprocess_info_schema, context=self._context
-            )
-            expression = expression.transform(
-                preprocess_current_schema, context=self._context
-            )
-            expression = expression.transform(
-                preprocess_system_calls, context=self._context
-            )
-            expression = expression.transform(
-                preprocess_semi_structured, context=self._context
-            )
+            # Identifier, info schema, current schema, system call and
+            # semi-structured rewrites share a single tree walk.
+            expression = expression.transform(preprocess_fused, context=self._context)
             expression = expression.transform(
                 preprocess_generator, context=self._context
             )
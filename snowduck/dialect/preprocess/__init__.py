@@ -1,6 +1,7 @@
 """Preprocessing functions for SQL transpilation."""
 
 from .dates import preprocess_date_functions
+from .fused import preprocess_fused
 from .generators import (
     preprocess_bitwise,
     preprocess_generator,
@@ -20,6 +21,7 @@ __all__ = [
     "preprocess_info_schema",
     "preprocess_current_schema",
     "preprocess_system_calls",
+    "preprocess_fused",
     "preprocess_generator",
     "preprocess_seq_functions",
     "preprocess_bitwise",
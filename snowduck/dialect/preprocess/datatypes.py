@@ -0,0 +1,19 @@
+"""DataType templates shared by the preprocessors.
+
+DataType.build parses its argument, so each type is built once here and
+callers hand out copies (a node can only belong to one tree).
+"""
+
+from typing import Final
+
+from sqlglot import exp
+
+BLOB_T: Final = exp.DataType.build("BLOB")
+VARCHAR_T: Final = exp.DataType.build("VARCHAR")
+BOOLEAN_T: Final = exp.DataType.build("BOOLEAN")
+DOUBLE_T: Final = exp.DataType.build("DOUBLE")
+DATE_T: Final = exp.DataType.build("DATE")
+TIMESTAMP_T: Final = exp.DataType.build("TIMESTAMP")
+INT_T: Final = exp.DataType.build("INT")
+JSON_T: Final = exp.DataType.build("JSON")
+INTARR_T: Final = exp.DataType.build("INT[]")
@@ -10,6 +10,8 @@ import re
 from sqlglot import exp
 
 from ..context import DialectContext
+from .datatypes import DATE_T, TIMESTAMP_T
+from .names import upper_name
 
 
 def _looks_like_date(value: str) -> bool:
@@ -28,7 +30,7 @@ def _cast_to_date(expr: exp.Expression) -> exp.Expression:
     """Wrap expression in CAST to DATE if it's a string literal that looks like a date."""
     if isinstance(expr, exp.Literal) and expr.is_string:
         if _looks_like_date(expr.this):
-            return exp.Cast(this=expr, to=exp.DataType.build("DATE"))
+            return exp.Cast(this=expr, to=DATE_T.copy())
     return expr
 
 
@@ -36,7 +38,7 @@ def _cast_to_timestamp(expr: exp.Expression) -> exp.Expression:
     """Wrap expression in CAST to TIMESTAMP if it's a string literal that looks like a date/time."""
     if isinstance(expr, exp.Literal) and expr.is_string:
         if _looks_like_date(expr.this):
-            return exp.Cast(this=expr, to=exp.DataType.build("TIMESTAMP"))
+            return exp.Cast(this=expr, to=TIMESTAMP_T.copy())
     return expr
 
 
@@ -141,7 +143,7 @@ def preprocess_date_functions(
 
     # Handle Anonymous functions for HOUR, MINUTE, SECOND, DAYNAME, MONTHNAME, etc.
     if isinstance(expression, exp.Anonymous):
-        fname = expression.this.upper()
+        fname = upper_name(expression.this)
 
         # Date part extraction functions
         if fname in ("HOUR", "MINUTE", "SECOND"):
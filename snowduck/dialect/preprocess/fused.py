@@ -0,0 +1,48 @@
+"""Single-pass reference and semi-structured preprocessing.
+
+Runs preprocess_identifier, preprocess_info_schema, preprocess_current_schema,
+preprocess_system_calls and preprocess_semi_structured in one tree walk,
+producing the same result as five consecutive ``transform`` calls.
+"""
+
+from sqlglot import exp
+
+from ..context import DialectContext
+from .identifiers import preprocess_identifier, preprocess_semi_structured
+from .info_schema import preprocess_info_schema
+from .system import preprocess_current_schema, preprocess_system_calls
+
+
+def _preprocess_references(
+    expression: exp.Expression, context: DialectContext
+) -> exp.Expression:
+    """Apply the identifier, info schema, current schema and system call passes."""
+    node_type = type(expression)
+    if node_type is exp.Anonymous:
+        expression = preprocess_identifier(expression, context)
+    elif node_type is exp.Table:
+        # The info schema check reads the table name, so resolve
+        # FROM IDENTIFIER('...') first, as the separate passes would have.
+        if type(expression.this) is exp.Anonymous:
+            expression.set("this", preprocess_identifier(expression.this, context))
+        expression = preprocess_info_schema(expression, context)
+    elif node_type is exp.CurrentSchema:
+        return preprocess_current_schema(expression, context)
+
+    if isinstance(expression, exp.Func):
+        expression = preprocess_system_calls(expression, context)
+    return expression
+
+
+def preprocess_fused(
+    expression: exp.Expression, context: DialectContext
+) -> exp.Expression:
+    """Run the reference passes followed by preprocess_semi_structured on a node."""
+    expression = _preprocess_references(expression, context)
+    result = preprocess_semi_structured(expression, context)
+    if result is not expression:
+        # transform() does not descend into a replacement node, but the
+        # reference passes ran over the whole tree before semi-structured
+        # rewriting did, so finish them on the new subtree.
+        result = result.transform(_preprocess_references, context, copy=False)
+    return result
@@ -1,8 +1,201 @@
 """GENERATOR and sequence functions preprocessing."""
 
+from types import MappingProxyType
+from typing import Callable, Final, Mapping
+
 from sqlglot import exp
 
 from ..context import DialectContext
+from .datatypes import (
+    BLOB_T,
+    BOOLEAN_T,
+    DATE_T,
+    DOUBLE_T,
+    INT_T,
+    TIMESTAMP_T,
+    VARCHAR_T,
+)
+from .names import upper_name
+
+# Snowflake functions that map 1:1 onto a DuckDB function with the same
+# arguments: NAME -> (required argument count, DuckDB function name).
+# Calls with any other argument count are left untouched.
+_RENAMES: Final[Mapping[str, tuple[int, str]]] = MappingProxyType(
+    {
+        # Bitwise
+        "BITXOR": (2, "xor"),
+        # String functions
+        "TRANSLATE": (3, "translate"),
+        "REVERSE": (1, "reverse"),
+        "REPEAT": (2, "repeat"),
+        "ASCII": (1, "ascii"),
+        "CHR": (1, "chr"),
+        "UNICODE": (1, "unicode"),
+        "STARTSWITH": (2, "starts_with"),
+        "ENDSWITH": (2, "ends_with"),
+        # Date/time construction
+        "DATE_FROM_PARTS": (3, "make_date"),
+        # Numeric functions
+        "CBRT": (1, "cbrt"),
+        "FACTORIAL": (1, "factorial"),
+        "DEGREES": (1, "degrees"),
+        "RADIANS": (1, "radians"),
+        # Array functions
+        "ARRAY_CAT": (2, "list_concat"),
+        "ARRAY_APPEND": (2, "list_append"),
+        "ARRAY_REVERSE": (1, "list_reverse"),
+        "ARRAY_MIN": (1, "list_min"),
+        "ARRAY_MAX": (1, "list_max"),
+        "ARRAY_SUM": (1, "list_sum"),
+        "ARRAY_AGG_SUM": (1, "list_sum"),
+        "ARRAY_AVG": (1, "list_avg"),
+        "ARRAY_AGG_AVG": (1, "list_avg"),
+        "ARRAYS_OVERLAP": (2, "list_has_any"),
+        # JSON / object functions (VARIANT is JSON in DuckDB)
+        "OBJECT_KEYS": (1, "json_keys"),
+        "TO_JSON": (1, "to_json"),
+        "TO_VARIANT": (1, "to_json"),
+        # Aggregate functions
+        "ANY_VALUE": (1, "any_value"),
+        "BITAND_AGG": (1, "bit_and"),
+        "BITOR_AGG": (1, "bit_or"),
+        "BITXOR_AGG": (1, "bit_xor"),
+        "BOOLAND_AGG": (1, "bool_and"),
+        "BOOLOR_AGG": (1, "bool_or"),
+        "KURTOSIS": (1, "kurtosis"),
+        "SKEW": (1, "skewness"),
+        "COVAR_POP": (2, "covar_pop"),
+        "COVAR_SAMP": (2, "covar_samp"),
+        # Hash functions (approximation)
+        "MD5_NUMBER_LOWER64": (1, "hash"),
+        # Base64
+        "BASE64_DECODE_BINARY": (1, "from_base64"),
+        # Additional array functions
+        "ARRAY_DISTINCT": (1, "list_distinct"),
+    }
+)
+
+
+def _build_array_except(args: list[exp.Expression]) -> exp.Expression | None:
+    # ARRAY_EXCEPT(arr1, arr2) -> list_filter(arr1, x -> NOT list_contains(arr2, x))
+    if len(args) != 2:
+        return None
+    arr1, arr2 = args
+    return exp.Anonymous(
+        this="list_filter",
+        expressions=[
+            arr1,
+            exp.Lambda(
+                this=exp.Not(
+                    this=exp.Anonymous(
+                        this="list_contains",
+                        expressions=[arr2, exp.Identifier(this="x")],
+                    )
+                ),
+                expressions=[exp.Identifier(this="x")],
+            ),
+        ],
+    )
+
+
+def _build_array_intersection(args: list[exp.Expression]) -> exp.Expression | None:
+    # ARRAY_INTERSECTION(arr1, arr2) -> list_filter(arr1, x -> list_contains(arr2, x))
+    if len(args) != 2:
+        return None
+    arr1, arr2 = args
+    return exp.Anonymous(
+        this="list_filter",
+        expressions=[
+            arr1,
+            exp.Lambda(
+                this=exp.Anonymous(
+                    this="list_contains",
+                    expressions=[arr2, exp.Identifier(this="x")],
+                ),
+                expressions=[exp.Identifier(this="x")],
+            ),
+        ],
+    )
+
+
+def _build_convert_timezone(args: list[exp.Expression]) -> exp.Expression | None:
+    # CONVERT_TIMEZONE(target_tz, ts) -> timezone(target_tz, ts)
+    # CONVERT_TIMEZONE(source_tz, target_tz, ts)
+    #   -> timezone(target_tz, timezone('UTC', timezone(source_tz, ts)))
+    if len(args) == 2:
+        # Two args: (target_tz, timestamp) - assume source is UTC
+        target_tz, ts = args
+        return exp.Anonymous(this="timezone", expressions=[target_tz, ts])
+    if len(args) == 3:
+        source_tz, target_tz, ts = args
+        in_source = exp.Anonymous(this="timezone", expressions=[source_tz, ts])
+        in_utc = exp.Anonymous(
+            this="timezone", expressions=[exp.Literal.string("UTC"), in_source]
+        )
+        return exp.Anonymous(this="timezone", expressions=[target_tz, in_utc])
+    return None
+
+
+def _blob_cast(value: exp.Expression) -> exp.Cast:
+    # Direct construction: copying a prebuilt Cast template and swapping in
+    # the argument measures slower than building the Cast around a type copy.
+    return exp.Cast(this=value, to=BLOB_T.copy())
+
+
+def _build_sha2(args: list[exp.Expression]) -> exp.Expression | None:
+    # SHA2(str) or SHA2(str, bits) -> sha256(str::BLOB)
+    # Snowflake defaults to SHA-256 (256 bits)
+    if not args:
+        return None
+    return exp.Anonymous(this="sha256", expressions=[_blob_cast(args[0])])
+
+
+def _build_sha1(args: list[exp.Expression]) -> exp.Expression | None:
+    # SHA1(str) -> sha1(str::BLOB)
+    if len(args) != 1:
+        return None
+    return exp.Anonymous(this="sha1", expressions=[_blob_cast(args[0])])
+
+
+def _build_hex_encode(args: list[exp.Expression]) -> exp.Expression | None:
+    # HEX_ENCODE(str) -> hex(str::BLOB)
+    if not args:
+        return None
+    return exp.Anonymous(this="hex", expressions=[_blob_cast(args[0])])
+
+
+def _build_hex_decode_string(args: list[exp.Expression]) -> exp.Expression | None:
+    # HEX_DECODE_STRING(hex_str) -> unhex(hex_str)::VARCHAR
+    if not args:
+        return None
+    unhex_result = exp.Anonymous(this="unhex", expressions=[args[0]])
+    return exp.Cast(this=unhex_result, to=VARCHAR_T.copy())
+
+
+def _build_hex_decode_binary(args: list[exp.Expression]) -> exp.Expression | None:
+    # HEX_DECODE_BINARY(hex_str) -> unhex(hex_str)
+    if not args:
+        return None
+    return exp.Anonymous(this="unhex", expressions=[args[0]])
+
+
+# Snowflake functions whose translation needs more than a rename:
+# NAME -> builder taking the call arguments. A builder returns the
+# replacement node, or None to leave the call untouched.
+_HANDLERS: Final[
+    Mapping[str, Callable[[list[exp.Expression]], exp.Expression | None]]
+] = MappingProxyType(
+    {
+        "ARRAY_EXCEPT": _build_array_except,
+        "ARRAY_INTERSECTION": _build_array_intersection,
+        "CONVERT_TIMEZONE": _build_convert_timezone,
+        "SHA2": _build_sha2,
+        "SHA1": _build_sha1,
+        "HEX_ENCODE": _build_hex_encode,
+        "HEX_DECODE_STRING": _build_hex_decode_string,
+        "HEX_DECODE_BINARY": _build_hex_decode_binary,
+    }
+)
 
 
 def preprocess_special_expressions(
@@ -58,13 +251,16 @@ def preprocess_regexp_replace(
     if isinstance(expression, exp.RegexpReplace):
         # Check if there's a 'g' flag in the position argument
         position = expression.args.get("position")
-        if position and isinstance(position, exp.Literal) and position.this == "g":
-            # Reconstruct with 'g' as the modifiers for DuckDB
+        if position is None:
+            return expression
+        if type(position) is exp.Literal and position.this == "g":
+            # Reconstruct with 'g' as the modifiers for DuckDB, moving the
+            # existing 'g' literal over instead of allocating a new one
             return exp.RegexpReplace(
                 this=expression.this,
                 expression=expression.expression,
                 replacement=expression.args.get("replacement"),
-                modifiers=exp.Literal.string("g"),
+                modifiers=position,
             )
     return expression
 
@@ -125,19 +321,35 @@ def preprocess_seq_functions(
     """Transform sequence generation functions like SEQ4() to DuckDB equivalents."""
 
     if isinstance(expression, exp.Anonymous):
-        fname = expression.this.upper()
+        fname = upper_name(expression.this)
+        # Bind the arguments once; every branch below inspects them.
+        args = expression.expressions
+        n = len(args)
+
+        rename = _RENAMES.get(fname)
+        if rename is not None:
+            arity, target = rename
+            if n == arity:
+                return exp.Anonymous(this=target, expressions=args)
+            return expression
+
+        handler = _HANDLERS.get(fname)
+        if handler is not None:
+            result = handler(args)
+            if result is not None:
+                return result
+            return expression
+
         if fname == "EQUAL_NULL":
             # EQUAL_NULL(a, b) -> (a IS NOT DISTINCT FROM b)
             # This is Snowflake's NULL-safe equality comparison
             # DuckDB supports IS NOT DISTINCT FROM via NullSafeEQ
-            args = expression.expressions
-            if len(args) == 2:
+            if n == 2:
                 return exp.NullSafeEQ(this=args[0], expression=args[1])
 
         elif fname == "DIV0NULL":
             # DIV0NULL(a, b) -> CASE WHEN b = 0 THEN NULL ELSE a / b END
-            args = expression.expressions
-            if len(args) == 2:
+            if n == 2:
                 return exp.Case(
                     ifs=[
                         exp.If(
@@ -150,33 +362,23 @@ def preprocess_seq_functions(
 
         elif fname == "BITAND":
             # BITAND(a, b) -> (a & b) in DuckDB
-            args = expression.expressions
-            if len(args) == 2:
+            if n == 2:
                 return exp.BitwiseAnd(this=args[0], expression=args[1])
 
         elif fname == "BITOR":
             # BITOR(a, b) -> (a | b) in DuckDB
-            args = expression.expressions
-            if len(args) == 2:
+            if n == 2:
                 return exp.BitwiseOr(this=args[0], expression=args[1])
 
-        elif fname == "BITXOR":
-            # BITXOR(a, b) -> xor(a, b) in DuckDB
-            args = expression.expressions
-            if len(args) == 2:
-                return exp.Anonymous(this="xor", expressions=args)
-
         elif fname == "BITNOT":
             # BITNOT(a) -> ~a in DuckDB
-            args = expression.expressions
-            if len(args) == 1:
+            if n == 1:
                 return exp.BitwiseNot(this=args[0])
 
         elif fname == "TO_BOOLEAN":
             # TO_BOOLEAN(x) -> CAST(x AS BOOLEAN) in DuckDB
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Cast(this=args[0], to=exp.DataType.build("BOOLEAN"))
+            if n == 1:
+                return exp.Cast(this=args[0], to=BOOLEAN_T.copy())
 
         elif fname == "WIDTH_BUCKET":
             # WIDTH_BUCKET(expr, min, max, num_buckets) ->
@@ -185,8 +387,7 @@ def preprocess_seq_functions(
             #   WHEN expr >= max THEN num_buckets + 1
             #   ELSE FLOOR((expr - min) / (max - min) * num_buckets) + 1
             # END
-            args = expression.expressions
-            if len(args) == 4:
+            if n == 4:
                 expr, min_val, max_val, num_buckets = args
                 # Calculate: FLOOR((expr - min) * num_buckets / (max - min)) + 1
                 # This is equivalent to assigning to buckets 1..num_buckets
@@ -224,8 +425,7 @@ def preprocess_seq_functions(
             # REGEXP_COUNT(subject, pattern) ->
             # len(regexp_extract_all(subject, pattern))
             # DuckDB: SELECT length(regexp_extract_all('abc123def456', '[0-9]+'))
-            args = expression.expressions
-            if len(args) >= 2:
+            if n >= 2:
                 subject = args[0]
                 pattern = args[1]
                 extract_all = exp.Anonymous(
@@ -235,21 +435,18 @@ def preprocess_seq_functions(
 
         elif fname == "TRUNCATE":
             # TRUNCATE(x, p) -> TRUNC(x, p) in DuckDB
-            args = expression.expressions
             return exp.Anonymous(this="trunc", expressions=args)
 
         elif fname == "STRTOK":
             # STRTOK(string, delimiters, partNumber) -> split_part(string, delimiters, partNumber)
             # Snowflake: STRTOK('a,b,c', ',', 2) returns 'b'
             # DuckDB: split_part('a,b,c', ',', 2) returns 'b'
-            args = expression.expressions
-            if len(args) >= 2:
+            if n >= 2:
                 return exp.Anonymous(this="split_part", expressions=args)
 
         elif fname == "ADD_MONTHS":
             # ADD_MONTHS(date, months) -> date + INTERVAL months MONTH
-            args = expression.expressions
-            if len(args) == 2:
+            if n == 2:
                 date_expr = args[0]
                 months = args[1]
                 # Create INTERVAL expression
@@ -265,8 +462,7 @@ def preprocess_seq_functions(
 
         elif fname == "UNIFORM":
             # UNIFORM(min, max, seed) -> floor(random() * (max - min + 1) + min)
-            args = expression.expressions
-            if len(args) >= 2:
+            if n >= 2:
                 min_val = args[0]
                 max_val = args[1]
                 range_len = exp.Add(
@@ -277,7 +473,7 @@ def preprocess_seq_functions(
                     this=exp.Anonymous(this="random"), expression=range_len
                 )
                 shifted = exp.Add(this=exp.Floor(this=rand_scaled), expression=min_val)
-                return exp.Cast(this=shifted, to=exp.DataType.build("int"))
+                return exp.Cast(this=shifted, to=INT_T.copy())
 
         # =========================================================================
         # STRING FUNCTIONS
@@ -296,99 +492,42 @@ def preprocess_seq_functions(
             # CHARINDEX(substr, str) -> strpos(str, substr)
             # CHARINDEX(substr, str, start) -> strpos(str[start:], substr) + start - 1
             # Note: Snowflake CHARINDEX is 1-based, DuckDB strpos is 1-based
-            args = expression.expressions
-            if len(args) == 2:
+            if n == 2:
                 substr = args[0]
                 string = args[1]
                 return exp.Anonymous(this="strpos", expressions=[string, substr])
-            elif len(args) == 3:
+            elif n == 3:
                 # With start position - DuckDB strpos doesn't have start, use locate
                 substr = args[0]
                 string = args[1]
                 start = args[2]
                 return exp.Anonymous(this="instr", expressions=[string, substr, start])
 
-        elif fname == "TRANSLATE":
-            # TRANSLATE(str, from, to) -> translate(str, from, to) - DuckDB has this
-            args = expression.expressions
-            if len(args) == 3:
-                return exp.Anonymous(this="translate", expressions=args)
-
         elif fname == "SOUNDEX":
             # SOUNDEX(str) - DuckDB doesn't have this natively
             # Pass through - may work with extensions
             pass
 
-        elif fname == "REVERSE":
-            # REVERSE(str) -> reverse(str) - DuckDB has this
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="reverse", expressions=args)
-
-        elif fname == "REPEAT":
-            # REPEAT(str, n) -> repeat(str, n) - DuckDB has this
-            args = expression.expressions
-            if len(args) == 2:
-                return exp.Anonymous(this="repeat", expressions=args)
-
-        elif fname == "ASCII":
-            # ASCII(str) -> ascii(str) - DuckDB has this
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="ascii", expressions=args)
-
-        elif fname == "CHR":
-            # CHR(n) -> chr(n) - DuckDB has this
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="chr", expressions=args)
-
-        elif fname == "UNICODE":
-            # UNICODE(str) -> unicode(str) - DuckDB has this
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="unicode", expressions=args)
-
-        elif fname == "STARTSWITH":
-            # STARTSWITH(str, prefix) -> starts_with(str, prefix) - DuckDB has this
-            args = expression.expressions
-            if len(args) == 2:
-                return exp.Anonymous(this="starts_with", expressions=args)
-
-        elif fname == "ENDSWITH":
-            # ENDSWITH(str, suffix) -> ends_with(str, suffix) - DuckDB has this
-            args = expression.expressions
-            if len(args) == 2:
-                return exp.Anonymous(this="ends_with", expressions=args)
-
         # =========================================================================
         # DATE/TIME CONSTRUCTION FUNCTIONS
         # =========================================================================
-        elif fname == "DATE_FROM_PARTS":
-            # DATE_FROM_PARTS(year, month, day) -> make_date(year, month, day)
-            args = expression.expressions
-            if len(args) == 3:
-                return exp.Anonymous(this="make_date", expressions=args)
 
         elif fname == "TIME_FROM_PARTS":
             # TIME_FROM_PARTS(hour, minute, second[, nanosecond]) -> make_time(hour, minute, second)
-            args = expression.expressions
-            if len(args) >= 3:
+            if n >= 3:
                 # DuckDB make_time takes (hour, minute, second) - ignore nanoseconds
                 return exp.Anonymous(this="make_time", expressions=args[:3])
 
         elif fname == "TIMESTAMP_FROM_PARTS":
             # TIMESTAMP_FROM_PARTS(year, month, day, hour, minute, second[, nanosecond])
             # -> make_timestamp(year, month, day, hour, minute, second)
-            args = expression.expressions
-            if len(args) >= 6:
+            if n >= 6:
                 return exp.Anonymous(this="make_timestamp", expressions=args[:6])
 
         elif fname in ("TIMESTAMPADD", "TIMEADD"):
             # TIMESTAMPADD(unit, amount, date) -> date + INTERVAL amount unit
             # Same as DATEADD but with different argument order in some dialects
-            args = expression.expressions
-            if len(args) == 3:
+            if n == 3:
                 unit = args[0]
                 amount = args[1]
                 date_expr = args[2]
@@ -404,36 +543,12 @@ def preprocess_seq_functions(
 
         elif fname == "TIMEDIFF":
             # TIMEDIFF(unit, time1, time2) -> date_diff(unit, time1, time2)
-            args = expression.expressions
-            if len(args) == 3:
+            if n == 3:
                 return exp.DateDiff(unit=args[0], this=args[2], expression=args[1])
 
         # =========================================================================
         # NUMERIC FUNCTIONS
         # =========================================================================
-        elif fname == "CBRT":
-            # CBRT(x) -> cbrt(x) - DuckDB has this
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="cbrt", expressions=args)
-
-        elif fname == "FACTORIAL":
-            # FACTORIAL(n) -> factorial(n) - DuckDB has this
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="factorial", expressions=args)
-
-        elif fname == "DEGREES":
-            # DEGREES(radians) -> degrees(radians) - DuckDB has this
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="degrees", expressions=args)
-
-        elif fname == "RADIANS":
-            # RADIANS(degrees) -> radians(degrees) - DuckDB has this
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="radians", expressions=args)
 
         elif fname == "PI":
             # PI() -> pi() - DuckDB has this
@@ -442,96 +557,29 @@ def preprocess_seq_functions(
         # =========================================================================
         # ARRAY FUNCTIONS
         # =========================================================================
-        elif fname == "ARRAY_CAT":
-            # ARRAY_CAT(array1, array2) -> list_concat(array1, array2)
-            args = expression.expressions
-            if len(args) == 2:
-                return exp.Anonymous(this="list_concat", expressions=args)
-
-        elif fname == "ARRAY_APPEND":
-            # ARRAY_APPEND(array, elem) -> list_append(array, elem)
-            args = expression.expressions
-            if len(args) == 2:
-                return exp.Anonymous(this="list_append", expressions=args)
 
         elif fname == "ARRAY_PREPEND":
             # ARRAY_PREPEND(array, elem) -> list_prepend(elem, array)
             # Note: DuckDB list_prepend has (element, array) order!
-            args = expression.expressions
-            if len(args) == 2:
+            if n == 2:
                 array = args[0]
                 elem = args[1]
                 return exp.Anonymous(this="list_prepend", expressions=[elem, array])
 
         elif fname == "ARRAY_SORT":
             # ARRAY_SORT(array) -> list_sort(array)
-            args = expression.expressions
-            if len(args) >= 1:
+            if n >= 1:
                 return exp.Anonymous(this="list_sort", expressions=[args[0]])
 
-        elif fname == "ARRAY_REVERSE":
-            # ARRAY_REVERSE(array) -> list_reverse(array)
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="list_reverse", expressions=args)
-
-        elif fname == "ARRAY_MIN":
-            # ARRAY_MIN(array) -> list_min(array)
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="list_min", expressions=args)
-
-        elif fname == "ARRAY_MAX":
-            # ARRAY_MAX(array) -> list_max(array)
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="list_max", expressions=args)
-
-        elif fname in ("ARRAY_SUM", "ARRAY_AGG_SUM"):
-            # ARRAY_SUM(array) -> list_sum(array)
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="list_sum", expressions=args)
-
-        elif fname in ("ARRAY_AVG", "ARRAY_AGG_AVG"):
-            # ARRAY_AVG(array) -> list_avg(array)
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="list_avg", expressions=args)
-
-        elif fname == "ARRAYS_OVERLAP":
-            # ARRAYS_OVERLAP(array1, array2) -> list_has_any(array1, array2)
-            args = expression.expressions
-            if len(args) == 2:
-                return exp.Anonymous(this="list_has_any", expressions=args)
-
         # =========================================================================
         # JSON / OBJECT FUNCTIONS
         # =========================================================================
-        elif fname == "OBJECT_KEYS":
-            # OBJECT_KEYS(obj) -> json_keys(obj)
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="json_keys", expressions=args)
-
-        elif fname == "TO_JSON":
-            # TO_JSON(value) -> to_json(value) - DuckDB has this
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="to_json", expressions=args)
-
-        elif fname == "TO_VARIANT":
-            # TO_VARIANT(value) -> to_json(value) - VARIANT is JSON in DuckDB
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="to_json", expressions=args)
 
         elif fname == "CHECK_JSON":
             # CHECK_JSON(str) -> NULL if valid, error message if invalid
             # DuckDB: json_valid returns true/false
             # Return NULL if valid, else error message
-            args = expression.expressions
-            if len(args) == 1:
+            if n == 1:
                 json_valid = exp.Anonymous(this="json_valid", expressions=args)
                 return exp.Case(
                     ifs=[
@@ -543,278 +591,76 @@ def preprocess_seq_functions(
                     default=exp.Literal.string("Invalid JSON"),
                 )
 
-        # =========================================================================
-        # AGGREGATE FUNCTIONS
-        # =========================================================================
-        elif fname == "ANY_VALUE":
-            # ANY_VALUE(x) -> any_value(x) - DuckDB has this
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="any_value", expressions=args)
-
-        elif fname == "BITAND_AGG":
-            # BITAND_AGG(x) -> bit_and(x)
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="bit_and", expressions=args)
-
-        elif fname == "BITOR_AGG":
-            # BITOR_AGG(x) -> bit_or(x)
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="bit_or", expressions=args)
-
-        elif fname == "BITXOR_AGG":
-            # BITXOR_AGG(x) -> bit_xor(x)
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="bit_xor", expressions=args)
-
-        elif fname == "BOOLAND_AGG":
-            # BOOLAND_AGG(x) -> bool_and(x)
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="bool_and", expressions=args)
-
-        elif fname == "BOOLOR_AGG":
-            # BOOLOR_AGG(x) -> bool_or(x)
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="bool_or", expressions=args)
-
-        elif fname == "KURTOSIS":
-            # KURTOSIS(x) -> kurtosis(x) - DuckDB has this
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="kurtosis", expressions=args)
-
-        elif fname == "SKEW":
-            # SKEW(x) -> skewness(x) - DuckDB calls it skewness
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="skewness", expressions=args)
-
-        elif fname == "COVAR_POP":
-            # COVAR_POP(y, x) -> covar_pop(y, x) - DuckDB has this
-            args = expression.expressions
-            if len(args) == 2:
-                return exp.Anonymous(this="covar_pop", expressions=args)
-
-        elif fname == "COVAR_SAMP":
-            # COVAR_SAMP(y, x) -> covar_samp(y, x) - DuckDB has this
-            args = expression.expressions
-            if len(args) == 2:
-                return exp.Anonymous(this="covar_samp", expressions=args)
-
         # =========================================================================
         # HASH FUNCTIONS
         # =========================================================================
         elif fname == "HASH":
             # HASH(x) -> hash(x) - DuckDB has this
-            args = expression.expressions
             return exp.Anonymous(this="hash", expressions=args)
 
-        elif fname == "MD5_NUMBER_LOWER64":
-            # MD5_NUMBER_LOWER64(x) -> hash(x) as approximation
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="hash", expressions=args)
-
         # =========================================================================
         # MISCELLANEOUS FUNCTIONS
         # =========================================================================
         elif fname == "IFF":
             # IFF(condition, true_val, false_val) -> IF(condition, true_val, false_val)
             # DuckDB supports IF function
-            args = expression.expressions
-            if len(args) == 3:
+            if n == 3:
                 return exp.If(this=args[0], true=args[1], false=args[2])
 
         elif fname == "NVL":
             # NVL(expr, default) -> COALESCE(expr, default)
-            args = expression.expressions
-            if len(args) == 2:
+            if n == 2:
                 return exp.Coalesce(this=args[0], expressions=[args[1]])
 
         elif fname == "NVL2":
             # NVL2(expr, not_null_val, null_val) -> IF(expr IS NOT NULL, not_null_val, null_val)
-            args = expression.expressions
-            if len(args) == 3:
+            if n == 3:
                 condition = exp.Not(this=exp.Is(this=args[0], expression=exp.Null()))
                 return exp.If(this=condition, true=args[1], false=args[2])
 
         elif fname == "ZEROIFNULL":
             # ZEROIFNULL(expr) -> COALESCE(expr, 0)
-            args = expression.expressions
-            if len(args) == 1:
+            if n == 1:
                 return exp.Coalesce(this=args[0], expressions=[exp.Literal.number(0)])
 
         elif fname == "NULLIFZERO":
             # NULLIFZERO(expr) -> NULLIF(expr, 0)
-            args = expression.expressions
-            if len(args) == 1:
+            if n == 1:
                 return exp.Nullif(this=args[0], expression=exp.Literal.number(0))
 
         elif fname == "TRY_TO_NUMBER":
             # TRY_TO_NUMBER(str) -> TRY_CAST(str AS DOUBLE)
-            args = expression.expressions
-            if len(args) >= 1:
-                return exp.TryCast(this=args[0], to=exp.DataType.build("DOUBLE"))
+            if n >= 1:
+                return exp.TryCast(this=args[0], to=DOUBLE_T.copy())
 
         elif fname == "TRY_TO_DATE":
             # TRY_TO_DATE(str) -> TRY_CAST(str AS DATE)
-            args = expression.expressions
-            if len(args) >= 1:
-                return exp.TryCast(this=args[0], to=exp.DataType.build("DATE"))
+            if n >= 1:
+                return exp.TryCast(this=args[0], to=DATE_T.copy())
 
         elif fname == "TRY_TO_TIMESTAMP":
             # TRY_TO_TIMESTAMP(str) -> TRY_CAST(str AS TIMESTAMP)
-            args = expression.expressions
-            if len(args) >= 1:
-                return exp.TryCast(this=args[0], to=exp.DataType.build("TIMESTAMP"))
+            if n >= 1:
+                return exp.TryCast(this=args[0], to=TIMESTAMP_T.copy())
 
         elif fname == "TRY_TO_BOOLEAN":
             # TRY_TO_BOOLEAN(x) -> TRY_CAST(x AS BOOLEAN)
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.TryCast(this=args[0], to=exp.DataType.build("BOOLEAN"))
+            if n == 1:
+                return exp.TryCast(this=args[0], to=BOOLEAN_T.copy())
 
         # =========================================================================
         # BASE64 ENCODING FUNCTIONS
         # =========================================================================
         elif fname == "BASE64_ENCODE":
             # BASE64_ENCODE(str) -> base64(encode(str))
-            args = expression.expressions
-            if len(args) == 1:
+            if n == 1:
                 encode_call = exp.Anonymous(this="encode", expressions=args)
                 return exp.Anonymous(this="base64", expressions=[encode_call])
 
         elif fname == "BASE64_DECODE_STRING":
             # BASE64_DECODE_STRING(str) -> decode(from_base64(str))
-            args = expression.expressions
-            if len(args) == 1:
+            if n == 1:
                 from_base64_call = exp.Anonymous(this="from_base64", expressions=args)
                 return exp.Anonymous(this="decode", expressions=[from_base64_call])
 
-        elif fname == "BASE64_DECODE_BINARY":
-            # BASE64_DECODE_BINARY(str) -> from_base64(str) (returns BLOB)
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="from_base64", expressions=args)
-
-        # =========================================================================
-        # ADDITIONAL ARRAY FUNCTIONS
-        # =========================================================================
-        elif fname == "ARRAY_EXCEPT":
-            # ARRAY_EXCEPT(arr1, arr2) -> list_filter(arr1, x -> NOT list_contains(arr2, x))
-            args = expression.expressions
-            if len(args) == 2:
-                arr1 = args[0]
-                arr2 = args[1]
-                # Build: list_filter(arr1, x -> NOT list_contains(arr2, x))
-                lambda_param = exp.Identifier(this="x")
-                list_contains_call = exp.Anonymous(
-                    this="list_contains", expressions=[arr2, lambda_param]
-                )
-                negated = exp.Not(this=list_contains_call)
-                lambda_expr = exp.Lambda(this=negated, expressions=[lambda_param])
-                return exp.Anonymous(
-                    this="list_filter", expressions=[arr1, lambda_expr]
-                )
-
-        elif fname == "ARRAY_INTERSECTION":
-            # ARRAY_INTERSECTION(arr1, arr2) -> list_filter(arr1, x -> list_contains(arr2, x))
-            args = expression.expressions
-            if len(args) == 2:
-                arr1 = args[0]
-                arr2 = args[1]
-                # Build: list_filter(arr1, x -> list_contains(arr2, x))
-                lambda_param = exp.Identifier(this="x")
-                list_contains_call = exp.Anonymous(
-                    this="list_contains", expressions=[arr2, lambda_param]
-                )
-                lambda_expr = exp.Lambda(
-                    this=list_contains_call, expressions=[lambda_param]
-                )
-                return exp.Anonymous(
-                    this="list_filter", expressions=[arr1, lambda_expr]
-                )
-
-        elif fname == "ARRAY_DISTINCT":
-            # ARRAY_DISTINCT(arr) -> list_distinct(arr)
-            args = expression.expressions
-            if len(args) == 1:
-                return exp.Anonymous(this="list_distinct", expressions=args)
-
-        # =========================================================================
-        # TIMEZONE CONVERSION FUNCTIONS
-        # =========================================================================
-        elif fname == "CONVERT_TIMEZONE":
-            # CONVERT_TIMEZONE(target_tz, ts) -> timezone(target_tz, ts)
-            # CONVERT_TIMEZONE(source_tz, target_tz, ts) -> timezone(target_tz, timezone(source_tz, ts)::TIMESTAMPTZ)
-            args = expression.expressions
-            if len(args) == 2:
-                # Two args: (target_tz, timestamp) - assume source is UTC
-                target_tz = args[0]
-                ts = args[1]
-                return exp.Anonymous(this="timezone", expressions=[target_tz, ts])
-            elif len(args) == 3:
-                # Three args: (source_tz, target_tz, timestamp)
-                source_tz = args[0]
-                target_tz = args[1]
-                ts = args[2]
-                # First convert to UTC using source timezone, then to target
-                # timezone(target_tz, timezone('UTC', timezone(source_tz, ts)))
-                in_source = exp.Anonymous(this="timezone", expressions=[source_tz, ts])
-                in_utc = exp.Anonymous(
-                    this="timezone", expressions=[exp.Literal.string("UTC"), in_source]
-                )
-                return exp.Anonymous(this="timezone", expressions=[target_tz, in_utc])
-
-        # =========================================================================
-        # SHA HASH FUNCTIONS
-        # =========================================================================
-        elif fname == "SHA2":
-            # SHA2(str) or SHA2(str, bits) -> sha256(str::BLOB) by default
-            # Snowflake defaults to SHA-256 (256 bits)
-            args = expression.expressions
-            if len(args) >= 1:
-                str_expr = args[0]
-                # Cast to BLOB and apply sha256
-                blob_cast = exp.Cast(this=str_expr, to=exp.DataType.build("BLOB"))
-                return exp.Anonymous(this="sha256", expressions=[blob_cast])
-
-        elif fname == "SHA1":
-            # SHA1(str) -> sha1(str::BLOB)
-            args = expression.expressions
-            if len(args) == 1:
-                str_expr = args[0]
-                blob_cast = exp.Cast(this=str_expr, to=exp.DataType.build("BLOB"))
-                return exp.Anonymous(this="sha1", expressions=[blob_cast])
-
-        # =========================================================================
-        # HEX ENCODING FUNCTIONS
-        # =========================================================================
-        elif fname == "HEX_ENCODE":
-            # HEX_ENCODE(str) -> hex(str::BLOB)
-            args = expression.expressions
-            if len(args) >= 1:
-                str_expr = args[0]
-                blob_cast = exp.Cast(this=str_expr, to=exp.DataType.build("BLOB"))
-                return exp.Anonymous(this="hex", expressions=[blob_cast])
-
-        elif fname == "HEX_DECODE_STRING":
-            # HEX_DECODE_STRING(hex_str) -> unhex(hex_str)::VARCHAR
-            args = expression.expressions
-            if len(args) >= 1:
-                hex_expr = args[0]
-                unhex_result = exp.Anonymous(this="unhex", expressions=[hex_expr])
-                return exp.Cast(this=unhex_result, to=exp.DataType.build("VARCHAR"))
-
-        elif fname == "HEX_DECODE_BINARY":
-            # HEX_DECODE_BINARY(hex_str) -> unhex(hex_str)
-            args = expression.expressions
-            if len(args) >= 1:
-                return exp.Anonymous(this="unhex", expressions=[args[0]])
-
     return expression
@@ -0,0 +1,14 @@
+"""Name canonicalization shared by the preprocessors."""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=512)
+def upper_name(name: str) -> str:
+    """Return the upper-cased form of a function or object name.
+
+    The preprocessors upper-case the same handful of names on every AST
+    node they visit; caching returns the same str object instead of
+    allocating a new one per visit.
+    """
+    return name.upper()
@@ -1,8 +1,81 @@
 """Variable substitution preprocessing."""
 
+from types import MappingProxyType
+from typing import Callable, Final, Mapping
+
 from sqlglot import exp
 
 from ..context import DialectContext
+from .names import upper_name
+
+
+def coerce_variable_literal(value: str) -> exp.Literal:
+    """Convert a SET value to the literal substituted for $var references."""
+    # Plain integers are by far the most common numeric values; recognize
+    # them without going through the exception-driven fallback below.
+    digits = value[1:] if value[:1] in ("-", "+") else value
+    if digits.isdecimal():
+        return exp.Literal.number(int(value))
+
+    # Try to determine if it's a number or string
+    try:
+        # Try integer
+        int_val = int(value)
+        return exp.Literal.number(int_val)
+    except ValueError:
+        try:
+            # Try float
+            float_val = float(value)
+            return exp.Literal.number(float_val)
+        except ValueError:
+            # It's a string
+            return exp.Literal.string(value)
+
+
+def _resolve_variable(var_name: str, context: DialectContext) -> exp.Literal:
+    value = context.session_variables.get(var_name)
+    if value is None:
+        raise ValueError(f"Undefined session variable: ${var_name}")
+    # transform_set stores coerced literals; plain strings are still accepted
+    if isinstance(value, str):
+        return coerce_variable_literal(value)
+    return value.copy()
+
+
+def _handle_parameter(
+    expression: exp.Expression, context: DialectContext
+) -> exp.Expression:
+    # SQLGlot uses Parameter(this=Var(this=var_name)) for $var in Snowflake
+    if not isinstance(expression.this, exp.Var):
+        return expression
+
+    # Variable names repeat across statements, so share the upper-cased key
+    return _resolve_variable(upper_name(expression.this.name), context)
+
+
+def _handle_placeholder(
+    expression: exp.Expression, context: DialectContext
+) -> exp.Expression:
+    # Also check Placeholder (in case syntax varies)
+    # But skip anonymous ? placeholders - those are bind parameters, not session variables
+    # Anonymous ? placeholders have name='?' and this=None
+    if expression.name == "?" or expression.this is None:
+        return expression
+
+    return _resolve_variable(upper_name(expression.name), context)
+
+
+_HANDLERS: Final[
+    Mapping[
+        type[exp.Expression],
+        Callable[[exp.Expression, DialectContext], exp.Expression],
+    ]
+] = MappingProxyType(
+    {
+        exp.Parameter: _handle_parameter,
+        exp.Placeholder: _handle_placeholder,
+    }
+)
 
 
 def preprocess_variables(
@@ -14,54 +87,7 @@ def preprocess_variables(
     Snowflake: SELECT $my_var WHERE id = $filter_id
     DuckDB: SELECT 'hello' WHERE id = 1
     """
-    # Check if this is a Parameter node (SQLGlot uses this for $var in Snowflake)
-    if isinstance(expression, exp.Parameter):
-        # Parameter has this=Var(this=var_name)
-        if isinstance(expression.this, exp.Var):
-            var_name = (
-                expression.this.this.upper()
-                if isinstance(expression.this.this, str)
-                else expression.this.name.upper()
-            )
-            if var_name in context.session_variables:
-                value = context.session_variables[var_name]
-                # Try to determine if it's a number or string
-                try:
-                    # Try integer
-                    int_val = int(value)
-                    return exp.Literal.number(int_val)
-                except ValueError:
-                    try:
-                        # Try float
-                        float_val = float(value)
-                        return exp.Literal.number(float_val)
-                    except ValueError:
-                        # It's a string
-                        return exp.Literal.string(value)
-            else:
-                raise ValueError(f"Undefined session variable: ${var_name}")
-
-    # Also check Placeholder (in case syntax varies)
-    # But skip anonymous ? placeholders - those are bind parameters, not session variables
-    if isinstance(expression, exp.Placeholder):
-        # Anonymous ? placeholders have name='?' and this=None
-        # These are bind parameter placeholders for parameterized queries
-        if expression.name == "?" or expression.this is None:
-            return expression
-
-        var_name = expression.name.upper()
-        if var_name in context.session_variables:
-            value = context.session_variables[var_name]
-            try:
-                int_val = int(value)
-                return exp.Literal.number(int_val)
-            except ValueError:
-                try:
-                    float_val = float(value)
-                    return exp.Literal.number(float_val)
-                except ValueError:
-                    return exp.Literal.string(value)
-        else:
-            raise ValueError(f"Undefined session variable: ${var_name}")
-
-    return expression
+    handler = _HANDLERS.get(type(expression))
+    if handler is None:
+        return expression
+    return handler(expression, context)
@@ -1,9 +1,12 @@
 import json
 import os
+from typing import Callable
 
 from sqlglot import exp
 
 from .context import DialectContext
+from .preprocess.names import upper_name
+from .preprocess.variables import coerce_variable_literal
 
 
 def transform_set(expression: exp.Expression, context: DialectContext) -> str:
@@ -22,9 +25,9 @@ def transform_set(expression: exp.Expression, context: DialectContext) -> str:
                     val_node = set_item.this.expression
 
                     if isinstance(var_node, exp.Column):
-                        var_name = var_node.name.upper()
+                        var_name = upper_name(var_node.name)
                     elif isinstance(var_node, exp.Identifier):
-                        var_name = var_node.this.upper()
+                        var_name = upper_name(var_node.this)
                     else:
                         continue
 
@@ -35,8 +38,11 @@ def transform_set(expression: exp.Expression, context: DialectContext) -> str:
                         # For non-literal values, convert to SQL string
                         var_value = val_node.sql(dialect="duckdb")
 
-                    # Store in context
-                    context.session_variables[var_name] = var_value
+                    # Store the substitution literal so $var references
+                    # don't re-coerce the value on every use
+                    context.session_variables[var_name] = coerce_variable_literal(
+                        var_value
+                    )
 
         # Return a dummy SELECT to satisfy the execute
         return "SELECT 'Statement executed successfully.' AS status"
@@ -44,12 +50,37 @@ def transform_set(expression: exp.Expression, context: DialectContext) -> str:
     return ""
 
 
+def _target_identifier(expression: exp.Expression) -> exp.Identifier | None:
+    """Return the identifier naming a CREATE target without walking the tree.
+
+    CREATE DATABASE stores the name as Table.this, CREATE SCHEMA as Table.db.
+    """
+    target = expression.this
+    if isinstance(target, exp.Table):
+        for key in ("this", "db", "catalog"):
+            ident = target.args.get(key)
+            if isinstance(ident, exp.Identifier):
+                return ident
+    return expression.find(exp.Identifier)
+
+
+def _kind_name(kind: exp.Expression | str | None) -> str:
+    """Return the upper-cased statement kind (e.g. DATABASE, TABLE) or ''."""
+    if kind is None:
+        return ""
+    if isinstance(kind, str):
+        return upper_name(kind)
+    if isinstance(kind, exp.Var):
+        return upper_name(kind.name)
+    return str(kind).upper()
+
+
 def transform_create(expression: exp.Create, context: DialectContext) -> str:
     """Custom transformation for CREATE DATABASE/SCHEMA to use uppercase identifiers."""
-    kind = str(expression.args.get("kind")).upper()
+    kind = _kind_name(expression.args.get("kind"))
 
     if kind == "DATABASE":
-        ident = expression.find(exp.Identifier)
+        ident = _target_identifier(expression)
         if not ident:
             raise ValueError(
                 f"No identifier found in CREATE DATABASE statement: {expression.sql}"
@@ -63,7 +94,7 @@ def transform_create(expression: exp.Create, context: DialectContext) -> str:
         return f"ATTACH {if_not_exists}DATABASE '{db_file}' AS {db_name}"
 
     if kind == "SCHEMA":
-        ident = expression.find(exp.Identifier)
+        ident = _target_identifier(expression)
         if ident and not ident.quoted:
             # Uppercase unquoted schema names to match Snowflake behavior
             ident.set("this", ident.this.upper())
@@ -72,8 +103,11 @@ def transform_create(expression: exp.Create, context: DialectContext) -> str:
 
 
 def transform_describe(expression: exp.Describe, context: DialectContext) -> str:
-    if str(expression.args.get("kind")).upper() in ("TABLE", "VIEW"):
-        if table := expression.find(exp.Table):
+    if _kind_name(expression.args.get("kind")) in ("TABLE", "VIEW"):
+        table = expression.this
+        if not isinstance(table, exp.Table):
+            table = expression.find(exp.Table)
+        if table:
             database = table.catalog or context.current_database
             schema = table.db or context.current_schema
 
@@ -107,15 +141,16 @@ def transform_describe(expression: exp.Describe, context: DialectContext) -> str
 
 def transform_use(expression: exp.Use, context: DialectContext) -> str:
     """Convert USE SCHEMA/DATABASE to SET schema."""
-    kind = expression.args.get("kind")
-    if not isinstance(kind, exp.Var) or not kind.name:
+    kind_node = expression.args.get("kind")
+    if not isinstance(kind_node, exp.Var) or not kind_node.name:
         return expression.sql(dialect="duckdb")
 
-    if kind.name.upper() == "DATABASE":
+    kind = _kind_name(kind_node)
+    if kind == "DATABASE":
         database = expression.this.name
         return f"SET schema = '{database}.PUBLIC'"
 
-    elif kind.name.upper() == "SCHEMA":
+    elif kind == "SCHEMA":
         db_name = (
             expression.this.args.get("db").name
             if expression.this.args.get("db")
@@ -164,20 +199,20 @@ def transform_show(expression: exp.Show, context: DialectContext) -> str:
 
 def transform_lateral(expression: exp.Lateral, context: DialectContext) -> str:
     """Transform LATERAL FLATTEN/EXPLODE into DuckDB UNNEST."""
-    if isinstance(expression.this, exp.Explode):
-        kwarg = expression.this.args.get("this")
-        input_expr = kwarg.expression if isinstance(kwarg, exp.Kwarg) else kwarg
-        input_sql = (
-            input_expr.sql(dialect="duckdb") if input_expr is not None else "NULL"
-        )
+    this = expression.this
+    # Only LATERAL FLATTEN (parsed as Explode) needs rewriting
+    if type(this) is not exp.Explode:
+        return expression.sql(dialect="duckdb")
 
-        alias = expression.args.get("alias")
-        alias_name = (
-            alias.this.sql(dialect="duckdb") if alias and alias.this else "_flattened"
-        )
-        return f"LATERAL UNNEST({input_sql}) AS {alias_name}(VALUE)"
+    kwarg = this.args.get("this")
+    input_expr = kwarg.expression if type(kwarg) is exp.Kwarg else kwarg
+    input_sql = input_expr.sql(dialect="duckdb") if input_expr is not None else "NULL"
 
-    return expression.sql(dialect="duckdb")
+    alias = expression.args.get("alias")
+    alias_name = (
+        alias.this.sql(dialect="duckdb") if alias and alias.this else "_flattened"
+    )
+    return f"LATERAL UNNEST({input_sql}) AS {alias_name}(VALUE)"
 
 
 def transform_copy(expression: exp.Copy, context: DialectContext) -> str:
@@ -194,7 +229,7 @@ def transform_copy(expression: exp.Copy, context: DialectContext) -> str:
     files = expression.args.get("files") or []
     if files:
         first = files[0]
-        if isinstance(first, exp.Table) and isinstance(first.this, exp.Var):
+        if type(first) is exp.Table and type(first.this) is exp.Var:
             stage_path = str(first.this).lstrip("@")
 
     if not stage_path:
@@ -206,97 +241,83 @@ def transform_copy(expression: exp.Copy, context: DialectContext) -> str:
     return f"COPY {table_sql} FROM '{source_path}'"
 
 
+# CURRENT_SECONDARY_ROLES() is constant, so serialize it once
+_SECONDARY_ROLES_JSON = json.dumps({"roles": "", "value": "ALL"})
+
+# Session functions answered from the dialect context:
+# NAME -> (default column alias, value getter).
+_SESSION_FUNCTIONS: dict[str, tuple[str, Callable[[DialectContext], str]]] = {
+    "CURRENT_ROLE": ("ROLE", lambda c: c.current_role or "SYSADMIN"),
+    "CURRENT_SECONDARY_ROLES": (
+        "SECONDARY_ROLES",
+        lambda c: _SECONDARY_ROLES_JSON,
+    ),
+    "CURRENT_DATABASE": ("DATABASE", lambda c: c.current_database or ""),
+    "CURRENT_SCHEMA": ("SCHEMA", lambda c: c.current_schema or ""),
+    "CURRENT_WAREHOUSE": (
+        "WAREHOUSE",
+        lambda c: c.current_warehouse or "DEFAULT_WAREHOUSE",
+    ),
+}
+
+# Depending on the sqlglot version these are parsed as dedicated expression
+# types rather than Func names; resolve the classes once at import.
+_SESSION_EXPRESSIONS: dict[type[exp.Expression], str] = {
+    cls: name
+    for cls, name in (
+        (getattr(exp, "CurrentDatabase", None), "CURRENT_DATABASE"),
+        (getattr(exp, "CurrentSchema", None), "CURRENT_SCHEMA"),
+    )
+    if cls is not None
+}
+
+
+def _session_function(
+    expr: exp.Expression,
+) -> tuple[str, Callable[[DialectContext], str]] | None:
+    name = _SESSION_EXPRESSIONS.get(type(expr))
+    if name is None:
+        if not isinstance(expr, exp.Func):
+            return None
+        name = expr.name.upper()
+    return _SESSION_FUNCTIONS.get(name)
+
+
 def transform_current_session_info(
     expression: exp.Select, context: DialectContext
 ) -> str:
     """Transform session-related functions to DuckDB-compatible SQL. Returns original SQL if no transformations occur."""
-    transformed = False
-    select_expressions = []
-
-    for projection in expression.expressions:
-        transformed_expr = None
-        alias_name = None
-        expr = projection
-
-        # Handle cases where projection is an Alias with a Func or special current_* expressions
-        if isinstance(projection, exp.Alias):
-            expr = projection.this
+    projections = expression.expressions
+    # First pass: rewrite session functions only. Most SELECTs contain none,
+    # and then no projection needs to be rendered on its own.
+    rewritten: list[str | None] = []
+    for projection in projections:
+        is_alias = isinstance(projection, exp.Alias)
+        expr = projection.this if is_alias else projection
+
+        entry = _session_function(expr)
+        if entry is None:
+            rewritten.append(None)
+            continue
+
+        default_alias, get_value = entry
+        transformed_expr = f"'{get_value(context)}'"
+        if is_alias:
             alias_name = projection.alias
-            if alias_name is None:
-                alias_sql = None
-            elif isinstance(alias_name, str):
+            if isinstance(alias_name, str):
                 alias_sql = alias_name
             else:
                 alias_sql = alias_name.sql(dialect="duckdb")
-            current_database_cls = getattr(exp, "CurrentDatabase", None)
-            current_schema_cls = getattr(exp, "CurrentSchema", None)
-            if current_database_cls and isinstance(expr, current_database_cls):
-                database = context.current_database or ""
-                target_alias = alias_sql or "DATABASE"
-                transformed_expr = f"'{database}' AS {target_alias}"
-            elif current_schema_cls and isinstance(expr, current_schema_cls):
-                schema = context.current_schema or ""
-                target_alias = alias_sql or "SCHEMA"
-                transformed_expr = f"'{schema}' AS {target_alias}"
-            elif isinstance(expr, exp.Func):
-                func_name = expr.name.upper()
-
-                if func_name == "CURRENT_ROLE":
-                    role = context.current_role or "SYSADMIN"
-                    target_alias = alias_sql or "ROLE"
-                    transformed_expr = f"'{role}' AS {target_alias}"
-                elif func_name == "CURRENT_SECONDARY_ROLES":
-                    roles_json = json.dumps({"roles": "", "value": "ALL"})
-                    target_alias = alias_sql or "SECONDARY_ROLES"
-                    transformed_expr = f"'{roles_json}' AS {target_alias}"
-                elif func_name == "CURRENT_DATABASE":
-                    database = context.current_database or ""
-                    target_alias = alias_sql or "DATABASE"
-                    transformed_expr = f"'{database}' AS {target_alias}"
-                elif func_name == "CURRENT_SCHEMA":
-                    schema = context.current_schema or ""
-                    target_alias = alias_sql or "SCHEMA"
-                    transformed_expr = f"'{schema}' AS {target_alias}"
-                elif func_name == "CURRENT_WAREHOUSE":
-                    warehouse = context.current_warehouse or "DEFAULT_WAREHOUSE"
-                    target_alias = alias_sql or "WAREHOUSE"
-                    transformed_expr = f"'{warehouse}' AS {target_alias}"
-        else:
-            current_database_cls = getattr(exp, "CurrentDatabase", None)
-            current_schema_cls = getattr(exp, "CurrentSchema", None)
-            if current_database_cls and isinstance(expr, current_database_cls):
-                database = context.current_database or ""
-                transformed_expr = f"'{database}'"
-            elif current_schema_cls and isinstance(expr, current_schema_cls):
-                schema = context.current_schema or ""
-                transformed_expr = f"'{schema}'"
-            elif isinstance(expr, exp.Func):
-                func_name = expr.name.upper()
-                if func_name == "CURRENT_ROLE":
-                    role = context.current_role or "SYSADMIN"
-                    transformed_expr = f"'{role}'"
-                elif func_name == "CURRENT_SECONDARY_ROLES":
-                    roles_json = json.dumps({"roles": "", "value": "ALL"})
-                    transformed_expr = f"'{roles_json}'"
-                elif func_name == "CURRENT_DATABASE":
-                    database = context.current_database or ""
-                    transformed_expr = f"'{database}'"
-                elif func_name == "CURRENT_SCHEMA":
-                    schema = context.current_schema or ""
-                    transformed_expr = f"'{schema}'"
-                elif func_name == "CURRENT_WAREHOUSE":
-                    warehouse = context.current_warehouse or "DEFAULT_WAREHOUSE"
-                    transformed_expr = f"'{warehouse}'"
-
-        # Add transformed expression or fallback to DuckDB SQL
-        if transformed_expr:
-            transformed = True
-            select_expressions.append(transformed_expr)
-        else:
-            select_expressions.append(projection.sql(dialect="duckdb"))
+            transformed_expr += f" AS {alias_sql or default_alias}"
+        rewritten.append(transformed_expr)
 
     # Return original SQL if no transformation occurred
-    if not transformed:
+    if not any(rewritten):
         return expression.sql(dialect="duckdb")
 
+    # Second pass: fall back to DuckDB SQL for the untouched projections
+    select_expressions = [
+        sql if sql is not None else projection.sql(dialect="duckdb")
+        for sql, projection in zip(rewritten, projections, strict=True)
+    ]
     return f"SELECT {', '.join(select_expressions)}"
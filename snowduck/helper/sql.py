@@ -1,5 +1,24 @@
+import os
+import re
+from functools import lru_cache
 from typing import Any
 
+# Statement separators, comment markers and quotes must not appear in values
+# interpolated into SQL templates.
+_UNSAFE_RE = re.compile(r";|--|/\*|\*/|'")
+_PARAM_TYPES = (str, int, float)
+
+
+def _read_sql(filepath: str) -> str:
+    with open(filepath, "r", encoding="utf-8") as file:
+        return file.read()
+
+
+@lru_cache(maxsize=128)
+def _read_sql_cached(filepath: str, mtime: float) -> str:
+    # mtime is part of the cache key so an edited file is re-read.
+    return _read_sql(filepath)
+
 
 def load_sql(filepath: str, **params: Any) -> str:
     """
@@ -8,13 +27,16 @@ def load_sql(filepath: str, **params: Any) -> str:
     """
     # Validate params to ensure no unsafe characters
     for key, value in params.items():
-        if not isinstance(value, (str, int, float)):
+        if not isinstance(value, _PARAM_TYPES):
             raise ValueError(f"Invalid parameter type for {key}: {type(value)}")
-        if isinstance(value, str) and any(
-            char in value for char in [";", "--", "/*", "*/", "'"]
-        ):
+        if isinstance(value, str) and _UNSAFE_RE.search(value):
             raise ValueError(f"Unsafe characters detected in parameter {key}: {value}")
 
-    with open(filepath, "r", encoding="utf-8") as file:
-        sql = file.read()
+    try:
+        mtime = os.path.getmtime(filepath)
+    except OSError:
+        # Let open() report the problem
+        sql = _read_sql(filepath)
+    else:
+        sql = _read_sql_cached(filepath, mtime)
     return sql.format(**params)
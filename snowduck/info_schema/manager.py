@@ -1,5 +1,6 @@
 import os
 import re
+from functools import lru_cache
 from typing import Any
 
 from duckdb import DuckDBPyConnection
@@ -10,6 +11,18 @@ from ..macros import register_macros
 ACCOUNT_CATALOG_NAME = "_snowduck_account"
 INFO_SCHEMA_NAME = "_information_schema"
 
+# Length declared in a VARCHAR(n)/CHAR(n) type name
+_CHAR_LENGTH_RE = re.compile(r"(?:VARCHAR|CHAR)\((\d+)\)", re.IGNORECASE)
+# Integer types are reported as NUMBER(38, 0), as Snowflake does
+_INTEGER_TYPES = frozenset({"INTEGER", "BIGINT", "SMALLINT", "TINYINT"})
+
+
+@lru_cache(maxsize=256)
+def _render_sql(filename: str, params: tuple[tuple[str, str], ...]) -> str:
+    # The templates ship with the package and do not change at runtime, and
+    # SHOW/DESCRIBE statements are rendered with a small set of distinct names.
+    return load_sql(os.path.join(os.path.dirname(__file__), filename), **dict(params))
+
 
 class InfoSchemaManager:
     def __init__(
@@ -25,6 +38,13 @@ class InfoSchemaManager:
         self._account_catalog_name = account_catalog_name
         self._info_schema_name = info_schema_name
         self._columns_cache: dict[tuple[str, str, str], list[dict[str, Any]]] = {}
+        self._column_map_cache: dict[
+            tuple[str, str, str], dict[str, dict[str, Any]]
+        ] = {}
+        # Upper-cased names of databases and (database, schema) pairs known to
+        # exist, so repeated USE/connect calls skip the catalog queries.
+        self._known_databases: set[str] = set()
+        self._known_schemas: set[tuple[str, str]] = set()
         self._attach_account_database()
         self._create_account_information_schema()
 
@@ -50,12 +70,13 @@ class InfoSchemaManager:
         databases = self._execute_sql(
             "SELECT database_name FROM duckdb_databases()"
         ).fetchall()
-        db_names = [db[0] for db in databases]
+        self._known_databases.update(db[0].upper() for db in databases)
 
-        if self.account_catalog_name not in db_names:
+        if self.account_catalog_name.upper() not in self._known_databases:
             self._execute_sql(
                 f"ATTACH DATABASE ':memory:' AS {self.account_catalog_name}"
             )
+            self._known_databases.add(self.account_catalog_name.upper())
 
     def _create_account_information_schema(self) -> None:
         """
@@ -72,26 +93,38 @@ class InfoSchemaManager:
         """
         Checks if a database exists by querying the information schema.
         """
+        if database.upper() in self._known_databases:
+            return True
         query = """
             SELECT 1
             FROM information_schema.schemata
             WHERE upper(catalog_name) = upper($database)
         """
-        result = self._execute_sql(query, database=database).fetchone()
-        return result is not None
+        if self._execute_sql(query, database=database).fetchone() is None:
+            return False
+        self._known_databases.add(database.upper())
+        return True
 
     def has_schema(self, database: str, schema: str) -> bool:
         """
         Checks if a schema exists in the specified database.
         """
+        key = (database.upper(), schema.upper())
+        if key in self._known_schemas:
+            return True
         query = """
             SELECT 1
             FROM information_schema.schemata
             WHERE upper(catalog_name) = upper($database)
               AND upper(schema_name) = upper($schema)
         """
-        result = self._execute_sql(query, database=database, schema=schema).fetchone()
-        return result is not None
+        if (
+            self._execute_sql(query, database=database, schema=schema).fetchone()
+            is None
+        ):
+            return False
+        self._known_schemas.add(key)
+        return True
 
     def create_database_information_schema(
         self, *, database: str, schema: str | None = None
@@ -107,6 +140,7 @@ class InfoSchemaManager:
 
         if not self.has_database(database):
             self._execute_sql(f"ATTACH DATABASE ':memory:' AS {database}")
+            self._known_databases.add(database.upper())
             sql = load_sql(
                 self._get_filepath("database_information_schema.sql"),
                 account_catalog_name=self.account_catalog_name,
@@ -123,6 +157,7 @@ class InfoSchemaManager:
 
             if not self.has_schema(database, schema):
                 self._execute_sql(f"CREATE SCHEMA {database}.{schema}")
+                self._known_schemas.add((database.upper(), schema.upper()))
 
             self._execute_sql(f"SET SCHEMA='{database}.{schema}'")
 
@@ -130,14 +165,14 @@ class InfoSchemaManager:
         """
         Returns the SQL to describe a specific view in the information schema.
         """
-        return load_sql(
-            self._get_filepath("describe_info_schema.sql"),
+        return self._render_sql(
+            "describe_info_schema.sql",
             view=view,
         )
 
     def describe_table_sql(self, database: str, schema: str, table: str) -> str:
-        return load_sql(
-            self._get_filepath("describe_table.sql"),
+        return self._render_sql(
+            "describe_table.sql",
             account_catalog_name=self.account_catalog_name,
             info_schema_name=self.info_schema_name,
             database=database,
@@ -149,8 +184,8 @@ class InfoSchemaManager:
         """
         Returns the SQL to show all databases.
         """
-        return load_sql(
-            self._get_filepath("show_databases.sql"),
+        return self._render_sql(
+            "show_databases.sql",
             account_catalog_name=self.account_catalog_name,
         )
 
@@ -161,8 +196,11 @@ class InfoSchemaManager:
         Returns column metadata for a table from the account information schema.
         """
         key = (database.upper(), schema.upper(), table.upper())
-        if key in self._columns_cache:
-            return self._columns_cache[key]
+        # Empty results are cached too, so tables without columns don't
+        # re-run the fallback query
+        cached = self._columns_cache.get(key)
+        if cached is not None:
+            return cached
         query = f"""
             SELECT
                 column_name,
@@ -195,47 +233,57 @@ class InfoSchemaManager:
             """
             rows = self._execute_sql(fallback, table=table).fetchall()
 
+        search_char_len = _CHAR_LENGTH_RE.search
         result = []
-        for r in rows:
-            char_len = r[2]
-            data_type = r[5] if len(r) > 5 else None
-            if char_len is None and isinstance(data_type, str):
-                match = re.search(r"(VARCHAR|CHAR)\((\d+)\)", data_type, re.IGNORECASE)
-                if match:
-                    char_len = int(match[2])
-
-            numeric_precision = r[3]
-            numeric_scale = r[4]
-            if isinstance(data_type, str) and data_type.upper() in {
-                "INTEGER",
-                "BIGINT",
-                "SMALLINT",
-                "TINYINT",
-            }:
-                numeric_precision = 38
-                numeric_scale = 0
+        for name, is_nullable, char_len, precision, scale, *rest in rows:
+            data_type = rest[0] if rest else None
+            if isinstance(data_type, str):
+                if char_len is None and (match := search_char_len(data_type)):
+                    char_len = int(match[1])
+                if data_type.upper() in _INTEGER_TYPES:
+                    precision = 38
+                    scale = 0
 
             result.append(
                 {
-                    "name": r[0],
-                    "is_nullable": r[1],
+                    "name": name,
+                    "is_nullable": is_nullable,
                     "character_maximum_length": char_len,
-                    "numeric_precision": numeric_precision,
-                    "numeric_scale": numeric_scale,
+                    "numeric_precision": precision,
+                    "numeric_scale": scale,
                 }
             )
         self._columns_cache[key] = result
         return result
 
+    def get_table_column_map(
+        self, *, database: str, schema: str, table: str
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Returns get_table_columns keyed by column name.
+        """
+        key = (database.upper(), schema.upper(), table.upper())
+        column_map = self._column_map_cache.get(key)
+        if column_map is None:
+            columns = self.get_table_columns(
+                database=database, schema=schema, table=table
+            )
+            column_map = {c["name"]: c for c in columns}
+            self._column_map_cache[key] = column_map
+        return column_map
+
     def clear_cache(self) -> None:
         self._columns_cache.clear()
+        self._column_map_cache.clear()
+        self._known_databases.clear()
+        self._known_schemas.clear()
 
     def show_schemas_sql(self, *, database: str) -> str:
         """
         Returns the SQL to show all schemas for a database.
         """
-        return load_sql(
-            self._get_filepath("show_schemas.sql"),
+        return self._render_sql(
+            "show_schemas.sql",
             database=database,
             info_schema_name=self.info_schema_name,
         )
@@ -244,8 +292,8 @@ class InfoSchemaManager:
         """
         Returns the SQL to show all objects for a schema.
         """
-        return load_sql(
-            self._get_filepath("show_objects.sql"),
+        return self._render_sql(
+            "show_objects.sql",
             database=database,
             schema=schema,
             info_schema_name=self.info_schema_name,
@@ -257,6 +305,13 @@ class InfoSchemaManager:
         """
         return self._duck_conn.execute(sql, params)
 
+    def _render_sql(self, filename: str, **params: str) -> str:
+        """
+        Returns a rendered SQL template from this package, memoized on the
+        template name and parameters.
+        """
+        return _render_sql(filename, tuple(sorted(params.items())))
+
     def _get_filepath(self, filename: str) -> str:
         """
         Returns the full path to a file in the same directory as this script.
@@ -1,5 +1,7 @@
 """DuckDB macros to emulate Snowflake functions not native to DuckDB."""
 
+from functools import lru_cache
+
 from duckdb import DuckDBPyConnection
 
 # SQL macros to emulate Snowflake functions not native to DuckDB
@@ -30,9 +32,9 @@ _MACRO_DEFINITIONS = [
         "SOUNDEX",
         """
         CREATE OR REPLACE MACRO {schema}SOUNDEX(str) AS (
-            upper(str[1]) || 
+            upper(str[1]) ||
             lpad(
-                replace(replace(replace(replace(replace(replace(
+                translate(
                     regexp_replace(
                         regexp_replace(
                             translate(upper(str[2:]), 'AEIOUYHW', ''),
@@ -40,12 +42,7 @@ _MACRO_DEFINITIONS = [
                         ),
                         '([CGJKQSXZ])+', '2', 'g'
                     ),
-                    'D', '3'),
-                    'T', '3'),
-                    'L', '4'),
-                    'M', '5'),
-                    'N', '5'),
-                    'R', '6'
+                    'DTLMNR', '334556'
                 ),
                 3, '0'
             )[1:4]
@@ -55,6 +52,26 @@ _MACRO_DEFINITIONS = [
 ]
 
 
+# Each template has a single {schema} placeholder; split around it once so
+# formatting for a new database is plain string concatenation
+_MACRO_PARTS = tuple(
+    tuple(macro_template.split("{schema}", 1))
+    for _name, macro_template in _MACRO_DEFINITIONS
+)
+
+
+@lru_cache(maxsize=128)
+def _macro_statements(schema_prefix: str) -> tuple[str, ...]:
+    """Format each macro definition for a schema prefix."""
+    return tuple(before + schema_prefix + after for before, after in _MACRO_PARTS)
+
+
+@lru_cache(maxsize=128)
+def _macro_batch(schema_prefix: str) -> str:
+    """Join the formatted macro definitions into one multi-statement script."""
+    return ";\n".join(_macro_statements(schema_prefix))
+
+
 def register_macros(duck_conn: DuckDBPyConnection, database: str | None = None) -> None:
     """Register Snowflake-compatible macros in the DuckDB connection.
 
@@ -65,9 +82,16 @@ def register_macros(duck_conn: DuckDBPyConnection, database: str | None = None)
     """
     schema_prefix = f"{database}.main." if database else ""
 
-    for _name, macro_template in _MACRO_DEFINITIONS:
+    try:
+        duck_conn.execute(_macro_batch(schema_prefix))
+        return
+    except Exception:
+        # Fall back to one statement at a time so a single failing macro
+        # does not prevent the others from being registered
+        pass
+
+    for macro_sql in _macro_statements(schema_prefix):
         try:
-            macro_sql = macro_template.format(schema=schema_prefix)
             duck_conn.execute(macro_sql)
         except Exception:
             # Macro may already exist or fail for other reasons - continue
@@ -1,24 +1,68 @@
 import atexit
 import uuid
 from contextlib import ExitStack, contextmanager
+from typing import TYPE_CHECKING, Any
 from unittest.mock import patch as mock_patch
 
+import pyarrow as pa
+
 from .connector import Connector
 
+if TYPE_CHECKING:
+    from duckdb import DuckDBPyConnection
+
 _patch_ctx = None  # Global variable to track context
 
 
+# Rows per insert batch when write_pandas is called without a chunk_size;
+# DuckDB load throughput levels off around this size while memory keeps
+# growing with larger batches
+_WRITE_PANDAS_CHUNK_SIZE = 100_000
+
+
+def _insert_by_name(
+    duck_conn: "DuckDBPyConnection", qualified_table: str, df: Any
+) -> None:
+    """Insert a frame by column name, e.g. when the table has extra columns."""
+    columns = ", ".join(df.columns)
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except pa.ArrowException:
+        # Mixed-type object columns have no Arrow type; bind them row by row
+        placeholders = ", ".join(["?"] * len(df.columns))
+        duck_conn.executemany(
+            f"INSERT INTO {qualified_table} ({columns}) VALUES ({placeholders})",
+            list(df.itertuples(index=False, name=None)),
+        )
+        return
+
+    # Scan the frame as one Arrow batch rather than row by row
+    temp_name = f"_snowduck_df_{uuid.uuid4().hex}"
+    duck_conn.register(temp_name, table)
+    try:
+        duck_conn.execute(
+            f"INSERT INTO {qualified_table} ({columns}) "
+            f"SELECT {columns} FROM {temp_name}"
+        )
+    finally:
+        duck_conn.unregister(temp_name)
+
+
 def write_pandas(
     conn,
     df,
     table_name: str,
     database: str | None = None,
     schema: str | None = None,
+    chunk_size: int | None = None,
     **_kwargs,
 ):
     """
     Minimal Snowflake write_pandas replacement using DuckDB insertion.
 
+    Rows are inserted in batches of ``chunk_size`` rows (100,000 by default)
+    to bound peak memory on large frames.
+
     Returns a tuple consistent with snowflake.connector.pandas_tools.write_pandas:
     (success, nchunks, nrows, output)
     """
@@ -33,34 +77,38 @@ def write_pandas(
     else:
         qualified_table = table_name
 
-    temp_name = f"_snowduck_df_{uuid.uuid4().hex}"
-    view_created = False
-
-    try:
-        if hasattr(duck_conn, "from_df"):
-            try:
-                relation = duck_conn.from_df(df)
-                if hasattr(relation, "create_temp_view"):
-                    relation.create_temp_view(temp_name)
+    if chunk_size is None:
+        chunk_size = _WRITE_PANDAS_CHUNK_SIZE
+    elif chunk_size <= 0:
+        raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}")
+    chunks = [
+        df.iloc[start : start + chunk_size] for start in range(0, len(df), chunk_size)
+    ] or [df]
+
+    # Insert all chunks in one transaction so a failing chunk leaves none
+    # of the earlier ones behind. A failed statement aborts the transaction,
+    # so if a positional insert fails, start over inserting by name.
+    by_name = not hasattr(duck_conn, "from_df")
+    while True:
+        duck_conn.begin()
+        try:
+            for chunk in chunks:
+                if by_name:
+                    _insert_by_name(duck_conn, qualified_table, chunk)
                 else:
-                    relation.create_view(temp_name)
-                view_created = True
-                duck_conn.execute(
-                    f"INSERT INTO {qualified_table} SELECT * FROM {temp_name}"
-                )
-                return True, 1, len(df), []
-            except Exception:
-                view_created = False
-
-        columns = ", ".join(df.columns)
-        placeholders = ", ".join(["?"] * len(df.columns))
-        sql = f"INSERT INTO {qualified_table} ({columns}) VALUES ({placeholders})"
-        duck_conn.executemany(sql, list(df.itertuples(index=False, name=None)))
-    finally:
-        if view_created:
-            duck_conn.execute(f"DROP VIEW IF EXISTS {temp_name}")
+                    # Append straight from the frame; no intermediate view to
+                    # plan and drop
+                    duck_conn.from_df(chunk).insert_into(qualified_table)
+        except Exception:
+            duck_conn.rollback()
+            if by_name:
+                raise
+            by_name = True
+            continue
+        duck_conn.commit()
+        break
 
-    return True, 1, len(df), []
+    return True, len(chunks), len(df), []
 
 
 @contextmanager
@@ -73,15 +121,15 @@ def patch_snowflake(db_file: str = ":memory:", reset: bool = False):
                  or provide a file path for persistent storage (e.g., 'test_data.duckdb').
         reset: If True, deletes the database file before starting (default: False).
     """
-    import glob
     import os
 
     if reset and db_file != ":memory:":
         # Delete the main file and any related files (.wal, .tmp, etc.)
-        for pattern in [db_file, f"{db_file}.wal", f"{db_file}.tmp"]:
-            for file in glob.glob(pattern):
-                if os.path.exists(file):
-                    os.remove(file)
+        for path in (db_file, f"{db_file}.wal", f"{db_file}.tmp"):
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
 
     connector = Connector(db_file=db_file)
     targets = {
@@ -1,10 +1,44 @@
 """Data seeding utilities for SnowDuck - making test data easy!"""
 
-from typing import Any
+from typing import Any, cast
 
 import pandas as pd
 
 
+def _literal(value: Any) -> str:
+    """Render a single value as a SQL literal."""
+    if pd.isna(value):
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, pd.Timestamp):
+        return f"'{value.strftime('%Y-%m-%d %H:%M:%S')}'::TIMESTAMP"
+    # String - escape single quotes
+    escaped = str(value).replace("'", "''")
+    return f"'{escaped}'"
+
+
+def _column_literals(values: pd.Series) -> list[str]:
+    """Render a column as SQL literals, formatting it as a whole where the
+    dtype allows and falling back to per-value rendering for object columns.
+    """
+    if pd.api.types.is_bool_dtype(values):
+        literals = values.map({True: "TRUE", False: "FALSE"})
+    elif pd.api.types.is_numeric_dtype(values):
+        literals = values.map(str)
+    elif pd.api.types.is_datetime64_any_dtype(values):
+        literals = "'" + values.dt.strftime("%Y-%m-%d %H:%M:%S") + "'::TIMESTAMP"
+    elif pd.api.types.is_string_dtype(values) and not pd.api.types.is_object_dtype(
+        values
+    ):
+        literals = "'" + values.str.replace("'", "''", regex=False) + "'"
+    else:
+        return [_literal(value) for value in values.tolist()]
+    return cast(list[str], literals.where(values.notna(), "NULL").tolist())
+
+
 def seed_table(
     conn,
     table_name: str,
@@ -60,28 +94,20 @@ def seed_table(
     if drop_if_exists:
         cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
 
-    # Build CREATE TABLE AS SELECT FROM VALUES
-    # This is the most reliable approach for all data types
-    rows = []
-    for _, row in df.iterrows():
-        values = []
-        for _, value in row.items():
-            if pd.isna(value):
-                values.append("NULL")
-            elif isinstance(value, (int, float)):
-                values.append(str(value))
-            elif isinstance(value, bool):
-                values.append("TRUE" if value else "FALSE")
-            elif isinstance(value, pd.Timestamp):
-                values.append(f"'{value.strftime('%Y-%m-%d %H:%M:%S')}'::TIMESTAMP")
-            else:
-                # String - escape single quotes
-                escaped = str(value).replace("'", "''")
-                values.append(f"'{escaped}'")
-        rows.append(f"({', '.join(values)})")
+    # Rows of an all-numeric frame with any float column share a float dtype,
+    # so integer columns have always been seeded as float literals (1.0)
+    # and typed as DECIMAL; keep that typing when formatting by column
+    row_dtype = df.iloc[:0].to_numpy().dtype
+    if row_dtype.kind == "f":
+        df = df.astype(row_dtype)
+
+    # Build CREATE TABLE AS SELECT FROM VALUES, formatting one column at a
+    # time; DuckDB types the literals just as it would hand-written SQL
+    columns = [_column_literals(df[column]) for column in df.columns]
+    rows = [f"({', '.join(row)})" for row in zip(*columns, strict=True)]
 
     # Build column list
-    columns = ", ".join(df.columns)
+    column_names = ", ".join(map(str, df.columns))
 
     # Build VALUES rows
     values_rows = ",\n            ".join(rows)
@@ -91,7 +117,7 @@ def seed_table(
         CREATE TABLE {table_name} AS
         SELECT * FROM (VALUES
             {values_rows}
-        ) AS t({columns})
+        ) AS t({column_names})
     """
 
     cursor.execute(sql)
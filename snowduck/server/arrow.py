@@ -1,15 +1,27 @@
-from typing import cast
+from __future__ import annotations
+
+import io
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, cast
 
 import pyarrow as pa
 import pyarrow.compute as pc
 
 from ..connector import ColumnInfo
 
+if TYPE_CHECKING:
+    from _typeshed import ReadableBuffer
+
 
 def to_sf_schema(schema: pa.Schema, rowtype: list[ColumnInfo]) -> pa.Schema:
     """
     Convert a PyArrow schema to a Snowflake-compatible schema.
 
+    Results are cached on the field names and types together with the
+    column metadata, so repeated queries with the same shape reuse the
+    converted schema.
+
     Args:
         schema (pa.Schema): The PyArrow schema.
         rowtype (list[ColumnInfo]): Column metadata information.
@@ -25,66 +37,137 @@ def to_sf_schema(schema: pa.Schema, rowtype: list[ColumnInfo]) -> pa.Schema:
             f"Schema and rowtype must have the same length: {len(schema)=}, {len(rowtype)=}"
         )
 
-    def sf_field(field: pa.Field, column: ColumnInfo) -> pa.Field:
-        """
-        Convert a PyArrow field to a Snowflake-compatible field.
-
-        Args:
-            field (pa.Field): The PyArrow field.
-            column (ColumnInfo): Column metadata.
-
-        Returns:
-            pa.Field: A transformed Snowflake-compatible field.
-        """
-        if isinstance(field.type, pa.TimestampType):
-            fields = [
-                pa.field("epoch", pa.int64(), nullable=False),
-                pa.field("fraction", pa.int32(), nullable=False),
-            ]
-            if field.type.tz:
-                fields.append(pa.field("timezone", pa.int32(), nullable=False))
-            field = field.with_type(pa.struct(fields))
-        elif isinstance(field.type, pa.Time64Type):
-            field = field.with_type(pa.int64())
-        elif pa.types.is_uint64(field.type):
-            field = field.with_type(pa.int64())
-
-        return field.with_metadata(
-            {
-                "logicalType": column["type"].upper(),
-                "precision": str(column["precision"] or 38),
-                "scale": str(column["scale"] or 0),
-                "charLength": str(column["length"] or 0),
-            }
-        )
+    return _sf_schema(
+        tuple((field.name, field.type, field.nullable) for field in schema),
+        tuple((c["type"], c["precision"], c["scale"], c["length"]) for c in rowtype),
+    )
+
+
+@lru_cache(maxsize=256)
+def _sf_schema(
+    fields: tuple[tuple[str, pa.DataType, bool], ...],
+    columns: tuple[tuple[str, int | None, int | None, int | None], ...],
+) -> pa.Schema:
+    """
+    Build the Snowflake-compatible schema for to_sf_schema.
+
+    Args:
+        fields (tuple): Name, type and nullability of each field.
+        columns (tuple): Type, precision, scale and length of each column.
+
+    Returns:
+        pa.Schema: A Snowflake-compatible schema.
+    """
+    return pa.schema(
+        [
+            _sf_field(pa.field(name, type_, nullable=nullable), column)
+            for (name, type_, nullable), column in zip(fields, columns, strict=True)
+        ]
+    )
+
+
+def _sf_field(
+    field: pa.Field[Any], column: tuple[str, int | None, int | None, int | None]
+) -> pa.Field[Any]:
+    """
+    Convert a PyArrow field to a Snowflake-compatible field.
 
-    return pa.schema([sf_field(schema.field(i), c) for i, c in enumerate(rowtype)])
+    Args:
+        field (pa.Field): The PyArrow field.
+        column (tuple): Type, precision, scale and length of the column.
+
+    Returns:
+        pa.Field: A transformed Snowflake-compatible field.
+    """
+    if isinstance(field.type, pa.TimestampType):
+        fields = [
+            pa.field("epoch", pa.int64(), nullable=False),
+            pa.field("fraction", pa.int32(), nullable=False),
+        ]
+        if field.type.tz:
+            fields.append(pa.field("timezone", pa.int32(), nullable=False))
+        field = field.with_type(pa.struct(fields))
+    elif isinstance(field.type, pa.Time64Type):
+        field = field.with_type(pa.int64())
+    elif pa.types.is_uint64(field.type):
+        field = field.with_type(pa.int64())
+
+    logical_type, precision, scale, length = column
+    return field.with_metadata(
+        {
+            "logicalType": logical_type.upper(),
+            "precision": str(precision or 38),
+            "scale": str(scale or 0),
+            "charLength": str(length or 0),
+        }
+    )
 
 
 def to_ipc(table: pa.Table) -> pa.Buffer:
     """
     Convert a PyArrow table to an IPC buffer.
 
+    Every record batch of the table is written to the stream as is, so
+    multi-chunk results are not combined into one batch first.
+
     Args:
         table (pa.Table): The PyArrow table.
 
     Returns:
         pa.Buffer: The serialized IPC buffer.
-
-    Raises:
-        NotImplementedError: If the table contains more than one batch.
     """
-    batches = table.to_batches()
-    if len(batches) != 1:
-        raise NotImplementedError(f"Expected 1 batch, but got {len(batches)}.")
-
     sink = pa.BufferOutputStream()
     with pa.ipc.new_stream(sink, table.schema) as writer:
-        writer.write_batch(batches[0])
+        writer.write_table(table)
 
     return sink.getvalue()
 
 
+class _ChunkSink(io.RawIOBase):
+    """Minimal writable file that collects what the IPC writer emits."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: ReadableBuffer) -> int:
+        chunk = bytes(data)
+        self.chunks.append(chunk)
+        return len(chunk)
+
+    def take(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def iter_ipc(table: pa.Table, max_chunksize: int | None = None) -> Iterator[bytes]:
+    """
+    Serialize a PyArrow table as an IPC stream, one record batch at a time.
+
+    Unlike to_ipc, the whole stream is never held in one buffer: each
+    record batch (the first one preceded by the schema message) is yielded
+    as soon as it is written.
+
+    Args:
+        table (pa.Table): The PyArrow table.
+        max_chunksize (int | None): Maximum number of rows per record batch.
+
+    Yields:
+        bytes: Consecutive pieces of the IPC stream.
+    """
+    sink = _ChunkSink()
+    writer = pa.ipc.new_stream(pa.PythonFile(sink, mode="w"), table.schema)
+    for batch in table.to_batches(max_chunksize=max_chunksize):
+        writer.write_batch(batch)
+        yield sink.take()
+    writer.close()
+    yield sink.take()
+
+
 def to_sf(table: pa.Table, rowtype: list[ColumnInfo]) -> pa.Table:
     """
     Convert a PyArrow table to a Snowflake-compatible format.
@@ -97,72 +180,117 @@ def to_sf(table: pa.Table, rowtype: list[ColumnInfo]) -> pa.Table:
         pa.Table: A transformed Snowflake-compatible table.
     """
 
-    def to_sf_col(col: pa.ChunkedArray) -> pa.Array | pa.ChunkedArray:
-        """
-        Transform a PyArrow column to Snowflake-compatible format.
+    # Only timestamp and time columns change representation; every other
+    # column is passed through untouched
+    columns: list[pa.Array[Any] | pa.ChunkedArray[Any]] = list(table.columns)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_timestamp(field.type):
+            columns[i] = timestamp_to_sf_struct(columns[i])
+        elif pa.types.is_time(field.type):
+            # Convert to nanoseconds
+            columns[i] = pc.multiply(columns[i].cast(pa.int64()), 1000)
 
-        Args:
-            col (pa.ChunkedArray): The input column.
+    return pa.Table.from_arrays(columns, schema=to_sf_schema(table.schema, rowtype))
 
-        Returns:
-            pa.Array | pa.ChunkedArray: The transformed column.
-        """
-        if pa.types.is_timestamp(col.type):
-            return timestamp_to_sf_struct(col)
-        if pa.types.is_time(col.type):
-            return pc.multiply(col.cast(pa.int64()), 1000)  # Convert to nanoseconds
-        return col
 
-    return pa.Table.from_arrays(
-        [to_sf_col(col) for col in table.columns],
-        schema=to_sf_schema(table.schema, rowtype),
-    )
+# Timestamp ticks per second for each Arrow time unit
+_UNITS_PER_SECOND = {
+    "s": 1,
+    "ms": 1_000,
+    "us": 1_000_000,
+    "ns": 1_000_000_000,
+}
 
 
-def timestamp_to_sf_struct(ts: pa.Array | pa.ChunkedArray) -> pa.Array:
+def timestamp_to_sf_struct(
+    ts: pa.Array[Any] | pa.ChunkedArray[Any],
+) -> pa.Array[Any] | pa.ChunkedArray[Any]:
     """
     Convert a timestamp column into a Snowflake-compatible struct.
 
+    Chunked columns are converted chunk by chunk, so the timestamp buffers
+    are never copied into one contiguous array.
+
     Args:
         ts (pa.Array | pa.ChunkedArray): The timestamp column.
 
     Returns:
-        pa.Array: The transformed timestamp column.
+        pa.Array | pa.ChunkedArray: The transformed timestamp column, chunked
+        the same way as the input.
 
     Raises:
-        ValueError: If the input column is not of type Timestamp.
-        AssertionError: If a timezone other than UTC is encountered.
+        ValueError: If the input column is not of type Timestamp, or has a
+            timezone other than UTC.
     """
-    if isinstance(ts, pa.ChunkedArray):
-        ts = cast(pa.Array, ts.combine_chunks())
-
     if not isinstance(ts.type, pa.TimestampType):
         raise ValueError(f"Expected TimestampArray, got {type(ts)}")
 
-    tsa_without_us = pc.floor_temporal(ts, unit="second")  # Strip subseconds
-    epoch = pc.divide(tsa_without_us.cast(pa.int64()), 1_000_000)
-    fraction = pc.multiply(pc.subsecond(ts), 1_000_000_000).cast(pa.int32())
+    if isinstance(ts, pa.ChunkedArray):
+        fields = _sf_timestamp_fields(ts.type)
+        return cast(
+            "pa.ChunkedArray[Any]",
+            pa.chunked_array(
+                [_timestamp_chunk_to_sf_struct(chunk, fields) for chunk in ts.chunks],
+                type=pa.struct(fields),  # type: ignore[call-overload]
+            ),
+        )
+
+    return _timestamp_chunk_to_sf_struct(ts, _sf_timestamp_fields(ts.type))
+
+
+def _sf_timestamp_fields(ts_type: pa.TimestampType) -> list[pa.Field[Any]]:
+    """
+    Return the struct fields for a timestamp type.
 
-    if ts.type.tz:
-        if ts.type.tz != "UTC":
+    Args:
+        ts_type (pa.TimestampType): The timestamp type.
+
+    Returns:
+        list[pa.Field]: The epoch and fraction fields, plus timezone for
+        timezone-aware timestamps.
+
+    Raises:
+        ValueError: If a timezone other than UTC is encountered.
+    """
+    fields = [
+        pa.field("epoch", pa.int64(), nullable=False),
+        pa.field("fraction", pa.int32(), nullable=False),
+    ]
+    if ts_type.tz:
+        if ts_type.tz != "UTC":
             raise ValueError(
-                f"Unsupported timezone: {ts.type.tz}. Only UTC is supported."
+                f"Unsupported timezone: {ts_type.tz}. Only UTC is supported."
             )
-        timezone = pa.array([1440] * len(ts), type=pa.int32())
-
-        return pa.StructArray.from_arrays(
-            [epoch, fraction, timezone],
-            fields=[
-                pa.field("epoch", pa.int64(), nullable=False),
-                pa.field("fraction", pa.int32(), nullable=False),
-                pa.field("timezone", pa.int32(), nullable=False),
-            ],
-        )
+        fields.append(pa.field("timezone", pa.int32(), nullable=False))
+    return fields
 
-    return pa.StructArray.from_arrays(
-        [epoch, fraction],
-        fields=[
-            pa.field("epoch", pa.int64(), nullable=False),
-            pa.field("fraction", pa.int32(), nullable=False),
-        ],
-    )
+
+def _timestamp_chunk_to_sf_struct(
+    ts: pa.Array[Any], fields: list[pa.Field[Any]]
+) -> pa.Array[Any]:
+    """
+    Convert a single timestamp array into a Snowflake-compatible struct.
+
+    Args:
+        ts (pa.Array): The timestamp array.
+        fields (list[pa.Field]): The struct fields from _sf_timestamp_fields.
+
+    Returns:
+        pa.Array: The struct array.
+    """
+    # Work on the integer timestamp values; the float result of subsecond
+    # cannot always be cast back to int32 exactly
+    per_second = _UNITS_PER_SECOND[ts.type.unit]
+    values = ts.cast(pa.int64())
+    seconds = pc.floor_temporal(ts, unit="second")  # Strip subseconds
+    epoch = pc.divide(seconds.cast(pa.int64()), per_second)
+    fraction = pc.subtract(values, pc.multiply(epoch, per_second))
+    if per_second != 1_000_000_000:
+        fraction = pc.multiply(fraction, 1_000_000_000 // per_second)
+
+    arrays: list[pa.Array[Any]] = [epoch, fraction.cast(pa.int32())]
+    if len(fields) == 3:
+        # Timezone offset in minutes plus 1440, i.e. UTC
+        arrays.append(pa.repeat(pa.scalar(1440, pa.int32()), len(ts)))
+
+    return pa.StructArray.from_arrays(arrays, fields=fields)
@@ -15,25 +15,97 @@ Handlers:
 
 from __future__ import annotations
 
-import gzip
 import json
+import logging
 import os
 import secrets
 from base64 import b64encode
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 import snowflake.connector
 from starlette.concurrency import run_in_threadpool
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response, StreamingResponse
 
 from ...connector import describe_as_rowtype
-from ..arrow import to_ipc, to_sf
-from ..serializers import serialize_rowset
+from ..arrow import iter_ipc, to_ipc, to_sf
+from ..serializers import decompress_gzip, serialize_arrow_rowset, serialize_json
 from ..shared import ServerError, session_manager, shared_connector
 
 if TYPE_CHECKING:
+    import pyarrow as pa
     from starlette.requests import Request
 
+    from ...connector import ColumnInfo, Connection, Cursor
+
+logger = logging.getLogger(__name__)
+
+
+def _json_body_response(body: bytes, status_code: int = 200) -> Response:
+    """Return a JSON response for an already encoded body."""
+    return Response(body, status_code=status_code, media_type="application/json")
+
+
+# Bodies of the constant responses, encoded once
+_SESSION_GONE_BODY = serialize_json(
+    {
+        "data": None,
+        "code": "390104",
+        "message": "Session no longer exists.",
+        "success": False,
+    }
+)
+_SESSION_OK_BODY = serialize_json(
+    {"data": None, "code": None, "message": None, "success": True}
+)
+_HEARTBEAT_BODY = serialize_json(
+    {
+        "data": {"masterValidatedTokens": {}},
+        "success": True,
+        "code": None,
+        "message": None,
+    }
+)
+_AUTHENTICATOR_BODY = serialize_json(
+    {
+        "data": {
+            "authnMethod": "PASSWORD",
+            "federationInfo": None,
+        },
+        "success": True,
+        "code": None,
+        "message": None,
+    }
+)
+_ABORT_BODY = serialize_json({"success": True})
+
+# Session parameters that are acknowledged without changing any state
+_ACCEPTED_SESSION_PARAMETERS = frozenset(
+    {
+        "TIMEZONE",
+        "DATE_OUTPUT_FORMAT",
+        "TIME_OUTPUT_FORMAT",
+        "TIMESTAMP_OUTPUT_FORMAT",
+        "QUERY_TAG",
+    }
+)
+
+# Session parameters applied by running a statement with the value
+_APPLIED_SESSION_PARAMETERS = {
+    "USE_DATABASE": "USE {}",
+    "USE_SCHEMA": "USE SCHEMA {}",
+}
+
+# Raw Arrow IPC stream responses, negotiated through the Accept header
+_ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+_ARROW_STREAM_BATCH_ROWS = 65_536
+
+# User agents of clients that expect JSON results by default
+_JSON_USER_AGENTS = ("snowflake-connector-nodejs", "snowflake-vsc", "snowflake vscode")
+
+# Approximate payload size of one JSON result chunk
+_DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+
 
 # =============================================================================
 # Authentication Handlers
@@ -54,12 +126,8 @@ async def login_request(request: "Request") -> JSONResponse:
     database = request.query_params.get("databaseName")
     schema = request.query_params.get("schemaName")
 
-    body = await request.body()
-    if request.headers.get("Content-Encoding") == "gzip":
-        body = gzip.decompress(body)
-
     # Parse body for future validation
-    _ = json.loads(body)
+    _ = await _read_json_body(request)
 
     token = secrets.token_urlsafe(32)
     connection = shared_connector.connect(database, schema)
@@ -76,7 +144,7 @@ async def login_request(request: "Request") -> JSONResponse:
     )
 
 
-async def session(request: "Request") -> JSONResponse:
+async def session(request: "Request") -> Response:
     """Handle session management.
 
     GET: Returns session info
@@ -91,10 +159,10 @@ async def session(request: "Request") -> JSONResponse:
     if bool(request.query_params.get("delete")):
         session_manager.delete_session(token)
 
-    return JSONResponse({"data": None, "code": None, "message": None, "success": True})
+    return _json_body_response(_SESSION_OK_BODY)
 
 
-async def get_session_info(request: "Request") -> JSONResponse:
+async def get_session_info(request: "Request") -> Response:
     """Get current session information.
 
     GET /session
@@ -102,15 +170,7 @@ async def get_session_info(request: "Request") -> JSONResponse:
     token = request.state.token
 
     if not session_manager.session_exists(token):
-        return JSONResponse(
-            {
-                "data": None,
-                "code": "390104",
-                "message": "Session no longer exists.",
-                "success": False,
-            },
-            status_code=401,
-        )
+        return _json_body_response(_SESSION_GONE_BODY, status_code=401)
 
     conn = session_manager.get_session(token)
 
@@ -157,7 +217,7 @@ async def get_session_info(request: "Request") -> JSONResponse:
     )
 
 
-async def heartbeat_request(request: "Request") -> JSONResponse:
+async def heartbeat_request(request: "Request") -> Response:
     """Handle session heartbeat.
 
     POST /session/heartbeat-request
@@ -165,45 +225,20 @@ async def heartbeat_request(request: "Request") -> JSONResponse:
     token = request.state.token
 
     if not session_manager.session_exists(token):
-        return JSONResponse(
-            {
-                "data": None,
-                "code": "390104",
-                "message": "Session no longer exists.",
-                "success": False,
-            },
-            status_code=401,
-        )
+        return _json_body_response(_SESSION_GONE_BODY, status_code=401)
 
-    return JSONResponse(
-        {
-            "data": {"masterValidatedTokens": {}},
-            "success": True,
-            "code": None,
-            "message": None,
-        }
-    )
+    return _json_body_response(_HEARTBEAT_BODY)
 
 
-async def authenticator_request(request: "Request") -> JSONResponse:
+async def authenticator_request(request: "Request") -> Response:
     """Return available authentication methods.
 
     POST /session/authenticator-request
     """
-    return JSONResponse(
-        {
-            "data": {
-                "authnMethod": "PASSWORD",
-                "federationInfo": None,
-            },
-            "success": True,
-            "code": None,
-            "message": None,
-        }
-    )
+    return _json_body_response(_AUTHENTICATOR_BODY)
 
 
-async def set_session_parameters(request: "Request") -> JSONResponse:
+async def set_session_parameters(request: "Request") -> Response:
     """Set session parameters.
 
     POST /session/parameters
@@ -211,56 +246,39 @@ async def set_session_parameters(request: "Request") -> JSONResponse:
     token = request.state.token
 
     if not session_manager.session_exists(token):
-        return JSONResponse(
-            {
-                "data": None,
-                "code": "390104",
-                "message": "Session no longer exists.",
-                "success": False,
-            },
-            status_code=401,
-        )
-
-    body = await request.body()
-    if request.headers.get("Content-Encoding") == "gzip":
-        body = gzip.decompress(body)
+        return _json_body_response(_SESSION_GONE_BODY, status_code=401)
 
-    body_json = json.loads(body)
+    body_json = await _read_json_body(request)
     parameters = body_json.get("parameters", [])
 
     conn = session_manager.get_session(token)
 
-    # Process each parameter
+    # Process each parameter, sharing one cursor for the USE statements
     applied = []
-    for param in parameters:
-        name = param.get("name", "").upper()
-        value = param.get("value")
-
-        try:
-            if name in (
-                "TIMEZONE",
-                "DATE_OUTPUT_FORMAT",
-                "TIME_OUTPUT_FORMAT",
-                "TIMESTAMP_OUTPUT_FORMAT",
-                "QUERY_TAG",
-            ):
-                applied.append({"name": name, "value": value, "status": "accepted"})
-            elif name == "USE_DATABASE":
-                cursor = conn.cursor()
-                cursor.execute(f"USE {value}")
-                cursor.close()
-                applied.append({"name": name, "value": value, "status": "applied"})
-            elif name == "USE_SCHEMA":
-                cursor = conn.cursor()
-                cursor.execute(f"USE SCHEMA {value}")
-                cursor.close()
-                applied.append({"name": name, "value": value, "status": "applied"})
-            else:
-                applied.append({"name": name, "value": value, "status": "ignored"})
-        except Exception as e:
-            applied.append(
-                {"name": name, "value": value, "status": "error", "message": str(e)}
-            )
+    cursor = None
+    try:
+        for param in parameters:
+            name = param.get("name", "").upper()
+            value = param.get("value")
+
+            try:
+                if name in _ACCEPTED_SESSION_PARAMETERS:
+                    status = "accepted"
+                elif name in _APPLIED_SESSION_PARAMETERS:
+                    if cursor is None:
+                        cursor = conn.cursor()
+                    cursor.execute(_APPLIED_SESSION_PARAMETERS[name].format(value))
+                    status = "applied"
+                else:
+                    status = "ignored"
+                applied.append({"name": name, "value": value, "status": status})
+            except Exception as e:
+                applied.append(
+                    {"name": name, "value": value, "status": "error", "message": str(e)}
+                )
+    finally:
+        if cursor is not None:
+            cursor.close()
 
     return JSONResponse(
         {
@@ -272,7 +290,7 @@ async def set_session_parameters(request: "Request") -> JSONResponse:
     )
 
 
-async def renew_session(request: "Request") -> JSONResponse:
+async def renew_session(request: "Request") -> Response:
     """Renew session token.
 
     POST /session/token-request
@@ -280,15 +298,7 @@ async def renew_session(request: "Request") -> JSONResponse:
     token = request.state.token
 
     if not session_manager.session_exists(token):
-        return JSONResponse(
-            {
-                "data": None,
-                "code": "390104",
-                "message": "Session no longer exists.",
-                "success": False,
-            },
-            status_code=401,
-        )
+        return _json_body_response(_SESSION_GONE_BODY, status_code=401)
 
     return JSONResponse(
         {
@@ -309,7 +319,7 @@ async def renew_session(request: "Request") -> JSONResponse:
 # =============================================================================
 
 
-async def query_request(request: "Request") -> JSONResponse:
+async def query_request(request: "Request") -> Response:
     """Execute SQL query.
 
     POST /queries/v1/query-request
@@ -317,31 +327,26 @@ async def query_request(request: "Request") -> JSONResponse:
     Request Body:
         sqlText: SQL statement
         queryResultFormat: "arrow" or "json"
-    """
-    token = request.state.token
-    conn = session_manager.get_session(token)
-    lock = session_manager.get_lock(token)
 
-    body = await request.body()
-    if request.headers.get("Content-Encoding") == "gzip":
-        body = gzip.decompress(body)
+    Clients sending ``Accept: application/vnd.apache.arrow.stream`` receive
+    the result set as a raw Arrow IPC stream instead of the JSON envelope.
+    """
+    session = request.state.session
+    conn = session.connection
+    lock = session.lock
 
-    body_json = json.loads(body)
+    body_json = await _read_json_body(request)
     sql_text = body_json["sqlText"]
     query_result_format = _detect_result_format(request, body_json)
 
-    print(body_json)
+    logger.debug("Query request body: %s", body_json)
 
     async with lock:
         try:
-            print("Executing SQL:", sql_text)
-            cur = await run_in_threadpool(conn.cursor().execute, sql_text)
-            describe_results = cur.describe_last_sql()
-            overrides = None
-            if cur.last_table_name and conn.database and conn.schema:
-                columns = conn.get_column_metadata(cur.last_table_name)
-                overrides = {c["name"]: c for c in columns}
-
+            logger.debug("Executing SQL: %s", sql_text)
+            cur, describe_results, overrides = await run_in_threadpool(
+                _run_query_sync, conn, sql_text
+            )
             rowtype = describe_as_rowtype(
                 describe_results,
                 database=conn.database,
@@ -349,6 +354,10 @@ async def query_request(request: "Request") -> JSONResponse:
                 table=cur.last_table_name,
                 overrides=overrides,
             )
+            # The next query may switch database or schema as soon as the
+            # lock is released, so record the ones this query ran in
+            database = conn._database or ""
+            schema = conn._schema or ""
         except snowflake.connector.errors.ProgrammingError as e:
             code = f"{e.errno:06d}"
             return JSONResponse(
@@ -363,16 +372,20 @@ async def query_request(request: "Request") -> JSONResponse:
             msg = f"Unhandled error during query {sql_text=}"
             raise ServerError(status_code=500, code="261000", message=msg) from None
 
-    data = _build_query_response(cur, conn, rowtype, query_result_format)
+    if cur._arrow_table is not None and _wants_arrow_stream(request):
+        # Empty results are streamed too; they still carry the schema
+        table = await run_in_threadpool(to_sf, cur._arrow_table, rowtype)
+        return StreamingResponse(
+            iter_ipc(table, _ARROW_STREAM_BATCH_ROWS),
+            media_type=_ARROW_STREAM_MEDIA_TYPE,
+        )
 
-    return JSONResponse(
-        {
-            "data": data,
-            "success": True,
-            "code": None,
-            "message": None,
-        }
+    # Only the cursor's own result is read from here on, so the response
+    # is built without holding the session lock, and off the event loop
+    body = await run_in_threadpool(
+        _encode_query_response, cur, rowtype, query_result_format, database, schema
     )
+    return _json_body_response(body)
 
 
 async def get_query_result(request: "Request") -> JSONResponse:
@@ -394,12 +407,12 @@ async def get_query_result(request: "Request") -> JSONResponse:
     )
 
 
-async def abort_request(request: "Request") -> JSONResponse:
+async def abort_request(request: "Request") -> Response:
     """Abort running query.
 
     POST /queries/v1/abort-request
     """
-    return JSONResponse({"success": True})
+    return _json_body_response(_ABORT_BODY)
 
 
 # =============================================================================
@@ -413,12 +426,8 @@ async def telemetry_send(request: "Request") -> JSONResponse:
     POST /telemetry/send
     """
     try:
-        body = await request.body()
-        if request.headers.get("Content-Encoding") == "gzip":
-            body = gzip.decompress(body)
-
-        body_json = json.loads(body)
-        print("Received telemetry data:", body_json)
+        body_json = await _read_json_body(request)
+        logger.debug("Received telemetry data: %s", body_json)
 
         return JSONResponse({"success": True, "message": "Telemetry data received."})
     except Exception as e:
@@ -434,31 +443,114 @@ async def telemetry_send(request: "Request") -> JSONResponse:
 # =============================================================================
 
 
+def _run_query_sync(
+    conn: Connection, sql_text: str
+) -> tuple[Cursor, list[Any], dict[str, dict[str, Any]] | None]:
+    """Execute a query and fetch its column metadata in one worker thread.
+
+    Describing the result and loading column metadata both hit DuckDB, so
+    they run alongside the query rather than on the event loop.
+    """
+    cur = conn.cursor().execute(sql_text)
+    describe_results = cur.describe_last_sql()
+    overrides = None
+    if cur.last_table_name and conn.database and conn.schema:
+        overrides = conn.get_column_metadata_map(cur.last_table_name)
+    return cur, describe_results, overrides
+
+
+async def _read_json_body(request: "Request") -> Any:
+    """Parse the JSON request body, decompressing gzip bodies as they stream in."""
+    if request.headers.get("Content-Encoding") != "gzip":
+        return json.loads(await request.body())
+
+    try:
+        body = await decompress_gzip(request.stream())
+    except ValueError as e:
+        raise ServerError(status_code=400, code="400001", message=str(e)) from None
+    return json.loads(body)
+
+
+def _wants_arrow_stream(request: "Request") -> bool:
+    """Check whether the client accepts a raw Arrow IPC stream response."""
+    return _ARROW_STREAM_MEDIA_TYPE in request.headers.get("Accept", "").lower()
+
+
 def _detect_result_format(request: "Request", body_json: dict) -> str:
     """Detect query result format from request."""
     query_result_format = body_json.get("queryResultFormat")
 
     if not query_result_format:
-        accept = request.headers.get("Accept", "").lower()
-        user_agent = request.headers.get("User-Agent", "").lower()
-        json_user_agents = [
-            "snowflake-connector-nodejs",
-            "snowflake-vsc",
-            "snowflake vscode",
-        ]
-        if "application/json" in accept or any(
-            tok in user_agent for tok in json_user_agents
-        ):
-            query_result_format = "json"
-        else:
-            query_result_format = "arrow"
+        query_result_format = _format_for_headers(
+            request.headers.get("Accept", ""), request.headers.get("User-Agent", "")
+        )
 
     return query_result_format
 
 
-def _build_query_response(cur, conn, rowtype: list, query_result_format: str) -> dict:
+@lru_cache(maxsize=256)
+def _format_for_headers(accept: str, user_agent: str) -> str:
+    """Pick the result format from the Accept and User-Agent headers.
+
+    Clients send the same headers on every request, so the decision is cached.
+    """
+    user_agent = user_agent.lower()
+    if "application/json" in accept.lower() or any(
+        tok in user_agent for tok in _JSON_USER_AGENTS
+    ):
+        return "json"
+    return "arrow"
+
+
+def _rows_per_chunk(table: pa.Table) -> int:
+    """Number of JSON rows per result chunk.
+
+    Chunks hold at most SNOWDUCK_CHUNK_SIZE rows and, using the table's
+    average row width in Arrow, roughly SNOWDUCK_CHUNK_BYTES bytes, so wide
+    rows are split into smaller chunks. A value of 0 disables either limit.
+    """
+    chunk_size = int(os.getenv("SNOWDUCK_CHUNK_SIZE", "1000"))
+    chunk_bytes = int(os.getenv("SNOWDUCK_CHUNK_BYTES", str(_DEFAULT_CHUNK_BYTES)))
+    if chunk_bytes > 0 and table.nbytes > 0:
+        rows_in_budget = max(1, chunk_bytes * table.num_rows // table.nbytes)
+        chunk_size = (
+            min(chunk_size, rows_in_budget) if chunk_size > 0 else rows_in_budget
+        )
+    return chunk_size
+
+
+def _encode_query_response(
+    cur: Cursor,
+    rowtype: list[ColumnInfo],
+    query_result_format: str,
+    database: str,
+    schema: str,
+) -> bytes:
+    """Build and encode a successful query response body.
+
+    Serializing the rows, base64 encoding and JSON encoding are all CPU
+    bound, so this runs in a worker thread.
+    """
+    data = _build_query_response(cur, rowtype, query_result_format, database, schema)
+    return serialize_json(
+        {
+            "data": data,
+            "success": True,
+            "code": None,
+            "message": None,
+        }
+    )
+
+
+def _build_query_response(
+    cur: Cursor,
+    rowtype: list[ColumnInfo],
+    query_result_format: str,
+    database: str,
+    schema: str,
+) -> dict[str, Any]:
     """Build query response data."""
-    data = {
+    data: dict[str, Any] = {
         "parameters": [],
         "rowtype": rowtype,
         "rowset": [],
@@ -466,10 +558,10 @@ def _build_query_response(cur, conn, rowtype: list, query_result_format: str) ->
         "returned": 0,
         "queryId": cur.sfqid,
         "sqlState": cur.sqlstate,
-        "database": conn._database or "",
-        "schema": conn._schema or "",
-        "finalDatabaseName": conn._database or "",
-        "finalSchemaName": conn._schema or "",
+        "database": database,
+        "schema": schema,
+        "finalDatabaseName": database,
+        "finalSchemaName": schema,
         "finalRoleName": "SYSADMIN",
         "chunkHeaders": None,
         "qrmk": None,
@@ -485,20 +577,19 @@ def _build_query_response(cur, conn, rowtype: list, query_result_format: str) ->
             data["returned"] = cur.rowcount
         else:
             # JSON/native format
-            rows = serialize_rowset(cur.fetchall())
-            chunk_size = int(os.getenv("SNOWDUCK_CHUNK_SIZE", "1000"))
+            rows = serialize_arrow_rowset(cur._arrow_table)
+            chunk_size = _rows_per_chunk(cur._arrow_table)
 
             if chunk_size > 0 and len(rows) > chunk_size:
                 first_chunk = rows[:chunk_size]
-                remaining = rows[chunk_size:]
                 chunks = []
-                for idx in range(0, len(remaining), chunk_size):
-                    chunk_rows = remaining[idx : idx + chunk_size]
+                for idx in range(chunk_size, len(rows), chunk_size):
+                    chunk_rows = rows[idx : idx + chunk_size]
                     chunks.append(
                         {
                             "rowCount": len(chunk_rows),
                             "rowset": chunk_rows,
-                            "chunkIndex": (idx // chunk_size) + 1,
+                            "chunkIndex": idx // chunk_size,
                         }
                     )
 
@@ -76,15 +76,17 @@ class TokenValidationMiddleware(BaseHTTPMiddleware):
         "/api/v2/",  # SQL REST API uses JWT auth, handled separately
     )
 
+    # Authorization header shape: Snowflake Token="<token>"
+    TOKEN_PREFIX = 'Snowflake Token="'
+    TOKEN_SUFFIX = '"'
+
     async def dispatch(
         self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
     ) -> Response:
         path = request.url.path
 
         # Skip validation for specific routes
-        if path in self.SKIP_PATHS or any(
-            path.startswith(prefix) for prefix in self.SKIP_PREFIXES
-        ):
+        if path in self.SKIP_PATHS or path.startswith(self.SKIP_PREFIXES):
             return await call_next(request)
 
         auth = request.headers.get("Authorization")
@@ -95,15 +97,21 @@ class TokenValidationMiddleware(BaseHTTPMiddleware):
                 message="Authorization header not found in the request data.",
             )
 
-        # Extract token from "Snowflake Token=\"...\"" format
-        token = auth[17:-1]
-        request.state.token = token  # Store token in request state for later use
+        # Extract token from "Snowflake Token=\"...\"" format; a malformed
+        # header is rejected without looking up a bogus token
+        session = None
+        if auth.startswith(self.TOKEN_PREFIX) and auth.endswith(self.TOKEN_SUFFIX):
+            token = auth[len(self.TOKEN_PREFIX) : -len(self.TOKEN_SUFFIX)]
+            request.state.token = token  # Store token in request state for later use
+            session = session_manager.get_or_none(token)
 
-        if not session_manager.session_exists(token):
+        if session is None:
             raise ServerError(
                 status_code=401,
                 code="390104",
                 message="User must login again to access the service.",
             )
+        # Handlers reuse the session looked up here
+        request.state.session = session
 
         return await call_next(request)
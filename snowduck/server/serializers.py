@@ -1,6 +1,52 @@
+from __future__ import annotations
+
+import json
+import zlib
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, List
+from typing import Any, AsyncIterable, List
+
+import pyarrow as pa
+
+
+def serialize_json(content: Any) -> bytes:
+    """
+    Encodes a response payload exactly as Starlette's JSONResponse renders it.
+    """
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+async def decompress_gzip(chunks: AsyncIterable[bytes]) -> bytes:
+    """
+    Decompresses a gzip body chunk by chunk as it streams in, so the whole
+    compressed body and its decompressed copy are never held at once.
+
+    Like gzip.decompress, concatenated gzip members are decompressed one
+    after another. Raises ValueError for corrupt or truncated data.
+    """
+    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    parts = []
+    received = False
+    try:
+        async for chunk in chunks:
+            while chunk:
+                received = True
+                if decompressor.eof:
+                    # The previous member ended; the rest is the next member
+                    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+                parts.append(decompressor.decompress(chunk))
+                chunk = decompressor.unused_data if decompressor.eof else b""
+    except zlib.error as e:
+        raise ValueError(f"Invalid gzip data: {e}") from None
+    if received and not decompressor.eof:
+        raise ValueError("Truncated gzip data")
+    return b"".join(parts)
 
 
 def serialize_item(item: Any) -> Any:
@@ -23,9 +69,41 @@ def serialize_item(item: Any) -> Any:
     return item
 
 
-def serialize_rowset(rows: List[tuple]) -> List[List[Any]]:
+def serialize_rowset(rows: List[tuple[Any, ...]]) -> List[List[Any]]:
     """
     Converts a list of row tuples (from Cursor.fetchall) into a list of list
     structures for Snowflake JSON response.
     """
     return [[serialize_item(cell) for cell in row] for row in rows]
+
+
+def _serialize_column(column: pa.ChunkedArray[Any]) -> List[Any]:
+    """
+    Serializes a whole result column the way serialize_item serializes
+    each of its cells, dispatching on the Arrow type once per column.
+    """
+    column_type = column.type
+    if pa.types.is_decimal(column_type):
+        # Arrow renders decimals exactly like str(Decimal)
+        return column.cast(pa.string()).to_pylist()
+
+    values = column.to_pylist()
+    if pa.types.is_date(column_type) or pa.types.is_timestamp(column_type):
+        return [None if value is None else value.isoformat() for value in values]
+    if (
+        pa.types.is_binary(column_type)
+        or pa.types.is_large_binary(column_type)
+        or pa.types.is_fixed_size_binary(column_type)
+    ):
+        return [None if value is None else value.hex() for value in values]
+    return values
+
+
+def serialize_arrow_rowset(table: pa.Table) -> List[List[Any]]:
+    """
+    Converts an Arrow result table into a list of list structures for the
+    Snowflake JSON response, producing the same values as serialize_rowset
+    on the fetched rows.
+    """
+    columns = [_serialize_column(column) for column in table.columns]
+    return [list(row) for row in zip(*columns, strict=True)]
@@ -26,13 +26,18 @@ Usage:
 
     # With custom host/port
     snowduck-server --host 0.0.0.0 --port 8080 --debug
+
+    # Log request details such as the SQL text of each query
+    snowduck-server --log-level debug
 """
 
 from __future__ import annotations
 
 import argparse
+import logging
 
 from starlette.applications import Starlette
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 from starlette.routing import Route
@@ -42,16 +47,19 @@ from .middleware import ErrorHandlingMiddleware, TokenValidationMiddleware
 from .sql_api import get_sql_api_routes
 from .streaming import streaming_routes
 
+logger = logging.getLogger(__name__)
+
 
 async def fallback_route(request: Request) -> JSONResponse:
     """Fallback route to log unmatched requests.
 
     This helps with debugging when connectors hit unexpected endpoints.
     """
-    print(f"[FALLBACK] Unmatched request: {request.method} {request.url}")
-    body = await request.body()
-    if body:
-        print(f"[FALLBACK] Request body: {body.decode('utf-8')}")
+    logger.warning("Unmatched request: %s %s", request.method, request.url)
+    if logger.isEnabledFor(logging.DEBUG):
+        body = await request.body()
+        if body:
+            logger.debug("Unmatched request body: %s", body.decode("utf-8"))
     return JSONResponse(
         {"success": False, "message": "Route not found."}, status_code=404
     )
@@ -81,8 +89,13 @@ def create_app(debug: bool = False) -> Starlette:
     app = Starlette(debug=debug, routes=routes)
 
     # Add middleware (order matters - last added runs first)
-    app.add_middleware(ErrorHandlingMiddleware)
+    # ErrorHandlingMiddleware wraps token validation so auth failures
+    # become 401 responses
     app.add_middleware(TokenValidationMiddleware)
+    app.add_middleware(ErrorHandlingMiddleware)
+    # Compress large result payloads for clients sending Accept-Encoding: gzip;
+    # a low level keeps the CPU cost well below the bandwidth saved
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
 
     return app
 
@@ -127,8 +140,17 @@ def main() -> None:
         help="Enable debug mode (default: False)",
     )
 
+    parser.add_argument(
+        "--log-level",
+        choices=["critical", "error", "warning", "info", "debug"],
+        default="info",
+        help="Log level for the server and request logging (default: info)",
+    )
+
     args = parser.parse_args()
 
+    logging.basicConfig(level=args.log_level.upper())
+
     # Recreate app with debug setting if needed
     if args.debug:
         application = create_app(debug=True)
@@ -141,7 +163,7 @@ def main() -> None:
     print("  - SQL REST API: /api/v2/statements*")
     print("  - Snowpipe Streaming: /v2/streaming/*")
 
-    run(application, host=args.host, port=args.port)
+    run(application, host=args.host, port=args.port, log_level=args.log_level)
 
 
 if __name__ == "__main__":
@@ -1,38 +1,62 @@
 import asyncio
-from typing import Dict
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
 
 from ..connector import Connection
 
 
+@dataclass
+class Session:
+    """A logged-in session: its connection and the lock serializing its queries."""
+
+    connection: Connection
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    last_used: float = field(default_factory=time.monotonic)
+
+
 class SessionManager:
-    def __init__(self) -> None:
-        self._sessions: Dict[str, Connection] = {}
-        self._locks: Dict[str, asyncio.Lock] = {}
+    """Tracks logged-in sessions by token.
+
+    Sessions are kept in least-recently-used order. Creating a session drops
+    sessions idle for longer than ``idle_timeout`` seconds and, beyond
+    ``max_sessions``, the least recently used ones, so tokens that clients
+    never log out do not accumulate.
+    """
+
+    def __init__(
+        self, max_sessions: int = 10_000, idle_timeout: float = 4 * 60 * 60
+    ) -> None:
+        self._sessions: OrderedDict[str, Session] = OrderedDict()
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
 
     def create_session(self, token: str, connection: Connection) -> None:
         """Creates a new session."""
-        self._sessions[token] = connection
-        self._locks[token] = asyncio.Lock()
+        self._evict(time.monotonic())
+        self._sessions[token] = Session(connection)
+
+    def get_or_none(self, token: str) -> Optional[Session]:
+        """Retrieves a session by token, or None if it does not exist."""
+        session = self._sessions.get(token)
+        if session is not None:
+            session.last_used = time.monotonic()
+            self._sessions.move_to_end(token)
+        return session
 
     def get_session(self, token: str) -> Connection:
         """Retrieves a session by token."""
-        if token not in self._sessions:
+        session = self._sessions.get(token)
+        if session is None:
             raise ValueError("Session not found. User must log in again.")
-        return self._sessions[token]
+        return session.connection
 
     def delete_session(self, token: str) -> None:
         """Deletes a session by token and closes the connection."""
-        if token in self._sessions:
-            conn = self._sessions[token]
-            try:
-                # Connection might not expose close directly if not wrapped, but our Connection does
-                if hasattr(conn, "close"):
-                    conn.close()
-            except Exception:
-                pass
-            del self._sessions[token]
-            if token in self._locks:
-                del self._locks[token]
+        session = self._sessions.pop(token, None)
+        if session is not None:
+            _close(session)
 
     def session_exists(self, token: str) -> bool:
         """Checks if a session exists for the given token."""
@@ -40,6 +64,37 @@ class SessionManager:
 
     def get_lock(self, token: str) -> asyncio.Lock:
         """Gets the lock for a session."""
-        if token not in self._locks:
+        session = self._sessions.get(token)
+        if session is None:
             raise ValueError("Session not found. User must log in again.")
-        return self._locks[token]
+        return session.lock
+
+    def _evict(self, now: float) -> None:
+        """Drop idle sessions, then the least recently used ones over capacity."""
+        # Oldest first, so stop at the first session that is still fresh once
+        # there is room. Sessions still running a query are skipped, not
+        # waited for.
+        evicted = []
+        remaining = len(self._sessions)
+        for token, session in self._sessions.items():
+            if session.lock.locked():
+                continue
+            if (
+                now - session.last_used <= self.idle_timeout
+                and remaining < self.max_sessions
+            ):
+                break
+            evicted.append(token)
+            remaining -= 1
+        for token in evicted:
+            _close(self._sessions.pop(token))
+
+
+def _close(session: Session) -> None:
+    conn = session.connection
+    try:
+        # Connection might not expose close directly if not wrapped, but our Connection does
+        if hasattr(conn, "close"):
+            conn.close()
+    except Exception:
+        pass
@@ -19,7 +19,13 @@ Modules:
 
 from .routes import get_sql_api_routes, sql_api_routes
 from .statement_manager import StatementManager, StatementResult, statement_manager
-from .types import build_row_type, format_row, format_value, type_code_to_name
+from .types import (
+    build_row_type,
+    format_row,
+    format_rows,
+    format_value,
+    type_code_to_name,
+)
 
 __all__ = [
     # Routes
@@ -32,6 +38,7 @@ __all__ = [
     # Type utilities
     "build_row_type",
     "format_row",
+    "format_rows",
     "format_value",
     "type_code_to_name",
 ]
@@ -13,20 +13,48 @@ Handlers:
 
 from __future__ import annotations
 
-import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
 import snowflake.connector
 
+from ..serializers import serialize_json
 from .statement_manager import statement_manager
-from .types import build_row_type, format_row
+from .types import build_row_type, format_rows
 
 if TYPE_CHECKING:
     from starlette.requests import Request
-    from starlette.responses import JSONResponse
+    from starlette.responses import JSONResponse, Response
+
+# Rows formatted and encoded per chunk of a streamed "data" array
+_STREAM_BATCH_ROWS = 1000
+
+
+def _convert_boolean(value: Any) -> bool:
+    """Convert a BOOLEAN bind value given as text or a number."""
+    return str(value).lower() in ("true", "1", "yes")
+
+
+# Converters for bind parameter values by binding type
+_BIND_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "FIXED": int,
+    "INTEGER": int,
+    "BIGINT": int,
+    "REAL": float,
+    "FLOAT": float,
+    "DOUBLE": float,
+    "BOOLEAN": _convert_boolean,
+}
+
+# Statistic reported for each DML statement keyword
+_DML_STATS = {
+    "INSERT": "numRowsInserted",
+    "UPDATE": "numRowsUpdated",
+    "DELETE": "numRowsDeleted",
+    "MERGE": "numRowsUpdated",
+}
 
 
-async def submit_statement(request: "Request") -> "JSONResponse":
+async def submit_statement(request: "Request") -> "Response":
     """Submit a SQL statement for execution.
 
     POST /api/v2/statements
@@ -49,10 +77,9 @@ async def submit_statement(request: "Request") -> "JSONResponse":
         async: If "true", return immediately with handle
         nullable: If "false", format nulls as "null" string
     """
+    from starlette.concurrency import run_in_threadpool
     from starlette.responses import JSONResponse
 
-    from ..shared import shared_connector
-
     # Parse request body
     body = await request.json()
     sql = body.get("statement", "")
@@ -102,28 +129,18 @@ async def submit_statement(request: "Request") -> "JSONResponse":
             status_code=202,
         )
 
-    # Execute synchronously
+    # Execute synchronously, in a worker thread to keep the event loop free
     try:
-        conn = shared_connector.connect(database, schema)
-        cur = conn.cursor()
-
-        # Execute with or without bind parameters
-        if bind_values:
-            cur.execute(sql, bind_values)
-        else:
-            cur.execute(sql)
-
-        # Fetch results
-        rows = cur.fetchall()
-        description = cur.description or []
+        rows, description, stats = await run_in_threadpool(
+            _execute_sync, sql, bind_values, database, schema
+        )
 
         stmt.status = "success"
-        stmt.result_data = [list(row) for row in rows]
+        # fetchall already returns a fresh list, so its rows are kept as is
+        stmt.result_data = rows
         stmt.result_meta = _build_result_metadata(description, rows, stmt)
         stmt.num_rows = len(rows)
-
-        # Collect DML stats if applicable
-        stmt.stats = _collect_dml_stats(sql, cur)
+        stmt.stats = stats
 
         statement_manager.update_statement(stmt)
 
@@ -136,14 +153,15 @@ async def submit_statement(request: "Request") -> "JSONResponse":
             "createdOn": stmt.created_on,
             "statementStatusUrl": f"/api/v2/statements/{stmt.handle}",
             "resultSetMetaData": stmt.result_meta,
-            "data": [format_row(row, nullable) for row in stmt.get_partition(0)],
         }
 
         if stmt.stats:
             response_data["stats"] = stmt.stats
 
         headers = _build_link_headers(stmt)
-        return JSONResponse(response_data, headers=headers)
+        return _stream_data_response(
+            response_data, stmt.get_partition(0), nullable, headers
+        )
 
     except snowflake.connector.errors.ProgrammingError as e:
         return _handle_programming_error(stmt, e)
@@ -151,7 +169,7 @@ async def submit_statement(request: "Request") -> "JSONResponse":
         return _handle_generic_error(stmt, e)
 
 
-async def get_statement_status(request: "Request") -> "JSONResponse":
+async def get_statement_status(request: "Request") -> "Response":
     """Get statement status and results.
 
     GET /api/v2/statements/{statementHandle}
@@ -239,14 +257,13 @@ async def get_statement_status(request: "Request") -> "JSONResponse":
         "createdOn": stmt.created_on,
         "statementStatusUrl": f"/api/v2/statements/{stmt.handle}",
         "resultSetMetaData": stmt.result_meta,
-        "data": [format_row(row, nullable) for row in partition_data],
     }
 
     if stmt.stats:
         response_data["stats"] = stmt.stats
 
     headers = _build_partition_headers(stmt, partition)
-    return JSONResponse(response_data, headers=headers)
+    return _stream_data_response(response_data, partition_data, nullable, headers)
 
 
 async def cancel_statement(request: "Request") -> "JSONResponse":
@@ -295,10 +312,9 @@ async def retry_statement(request: "Request") -> "JSONResponse":
 
     POST /api/v2/statements/{statementHandle}/retry
     """
+    from starlette.concurrency import run_in_threadpool
     from starlette.responses import JSONResponse
 
-    from ..shared import shared_connector
-
     handle = request.path_params["statementHandle"]
 
     stmt = statement_manager.get_statement(handle)
@@ -328,19 +344,15 @@ async def retry_statement(request: "Request") -> "JSONResponse":
     stmt.error_code = None
     stmt.error_message = None
     stmt.sql_state = None
-    stmt.created_on = int(time.time() * 1000)
+    statement_manager.restart_statement(stmt)
 
     try:
-        conn = shared_connector.connect(stmt.database, stmt.schema)
-        cursor = conn.cursor()
-        cursor.execute(stmt.sql)
-
-        # Fetch results
-        results = cursor.fetchall()
-        description = cursor.description or []
+        results, description, _ = await run_in_threadpool(
+            _execute_sync, stmt.sql, None, stmt.database, stmt.schema
+        )
 
         stmt.status = "success"
-        stmt.result_data = [list(row) for row in results]
+        stmt.result_data = results
         stmt.num_rows = len(results)
         stmt.result_meta = {
             "numRows": len(results),
@@ -357,7 +369,6 @@ async def retry_statement(request: "Request") -> "JSONResponse":
             else [],
         }
 
-        cursor.close()
         statement_manager.update_statement(stmt)
 
         return JSONResponse(
@@ -369,7 +380,7 @@ async def retry_statement(request: "Request") -> "JSONResponse":
                 "createdOn": stmt.created_on,
                 "statementStatusUrl": f"/api/v2/statements/{stmt.handle}",
                 "resultSetMetaData": stmt.result_meta,
-                "data": [format_row(row) for row in stmt.result_data],
+                "data": format_rows(stmt.result_data),
             }
         )
 
@@ -448,28 +459,51 @@ async def get_query_history(request: "Request") -> "JSONResponse":
 # =============================================================================
 
 
+def _execute_sync(
+    sql: str,
+    bind_values: tuple[Any, ...] | None,
+    database: str | None,
+    schema: str | None,
+) -> tuple[list[Any], list[Any], dict[str, int] | None]:
+    """Execute a statement and fetch its results.
+
+    Runs in a worker thread; returns the rows, the cursor description and
+    any DML statistics.
+    """
+    from ..shared import shared_connector
+
+    conn = shared_connector.connect(database, schema)
+    cur = conn.cursor()
+    try:
+        # Execute with or without bind parameters
+        if bind_values:
+            cur.execute(sql, bind_values)
+        else:
+            cur.execute(sql)
+
+        # Fetch results and collect DML stats if applicable
+        rows = cur.fetchall()
+        return rows, cur.description or [], _collect_dml_stats(sql, cur)
+    finally:
+        cur.close()
+
+
 def _convert_bindings(bindings: dict) -> tuple | None:
     """Convert binding parameters to tuple for SQL execution.
 
     Format: {"1":{"type":"FIXED","value":"123"}, "2":{"type":"TEXT","value":"hello"}}
     """
     bind_values = []
-    for key in sorted(bindings.keys(), key=lambda x: int(x)):
+    for key in sorted(bindings.keys(), key=int):
         binding = bindings[key]
         value = binding.get("value")
-        bind_type = binding.get("type", "TEXT").upper()
 
-        # Convert based on type
+        # Convert based on type; unknown types are bound as text
         if value is None:
             bind_values.append(None)
-        elif bind_type in ("FIXED", "INTEGER", "BIGINT"):
-            bind_values.append(int(value))
-        elif bind_type in ("REAL", "FLOAT", "DOUBLE"):
-            bind_values.append(float(value))
-        elif bind_type == "BOOLEAN":
-            bind_values.append(str(value).lower() in ("true", "1", "yes"))
         else:
-            bind_values.append(str(value))
+            convert = _BIND_CONVERTERS.get(binding.get("type", "TEXT").upper(), str)
+            bind_values.append(convert(value))
 
     return tuple(bind_values)
 
@@ -497,33 +531,46 @@ def _collect_dml_stats(sql: str, cursor: Any) -> dict | None:
     if not hasattr(cursor, "rowcount") or cursor.rowcount < 0:
         return None
 
-    sql_upper = sql.strip().upper()
-    if sql_upper.startswith("INSERT"):
-        return {"numRowsInserted": cursor.rowcount}
-    elif sql_upper.startswith("UPDATE"):
-        return {"numRowsUpdated": cursor.rowcount}
-    elif sql_upper.startswith("DELETE"):
-        return {"numRowsDeleted": cursor.rowcount}
-    elif sql_upper.startswith("MERGE"):
-        return {"numRowsUpdated": cursor.rowcount}
+    # Only the leading keyword matters, so never upper-case the whole text
+    head = sql.lstrip()[:6].upper()
+    stat = _DML_STATS.get(head) or _DML_STATS.get(head[:5])
+    if stat is None:
+        return None
+    return {stat: cursor.rowcount}
 
-    return None
 
+def _iter_json_envelope(
+    envelope: dict[str, Any], rows: list[Any], nullable: bool
+) -> Iterator[bytes]:
+    """Encode a response envelope followed by its "data" array of rows.
 
-def _build_link_headers(stmt: Any) -> dict:
-    """Build Link headers for partitioned results."""
-    partition_count = stmt.get_partition_count()
-    if partition_count <= 1:
-        return {}
+    Rows are formatted and encoded in batches as the response is sent, so
+    neither the formatted partition nor its full JSON text is held at once.
+    """
+    yield serialize_json(envelope)[:-1] + b',"data":['
+    for start in range(0, len(rows), _STREAM_BATCH_ROWS):
+        batch = format_rows(rows[start : start + _STREAM_BATCH_ROWS], nullable)
+        chunk = serialize_json(batch)[1:-1]
+        yield b"," + chunk if start else chunk
+    yield b"]}"
+
+
+def _stream_data_response(
+    envelope: dict[str, Any], rows: list[Any], nullable: bool, headers: dict[str, str]
+) -> "Response":
+    """Return a success response whose "data" rows are streamed."""
+    from starlette.responses import StreamingResponse
+
+    return StreamingResponse(
+        _iter_json_envelope(envelope, rows, nullable),
+        media_type="application/json",
+        headers=headers,
+    )
 
-    links = [
-        f'</api/v2/statements/{stmt.handle}?partition=0>; rel="first"',
-        f'</api/v2/statements/{stmt.handle}?partition={partition_count - 1}>; rel="last"',
-    ]
-    if partition_count > 1:
-        links.append(f'</api/v2/statements/{stmt.handle}?partition=1>; rel="next"')
 
-    return {"Link": ", ".join(links)}
+def _build_link_headers(stmt: Any) -> dict:
+    """Build Link headers for partitioned results."""
+    return _build_partition_headers(stmt, 0)
 
 
 def _build_partition_headers(stmt: Any, partition: int) -> dict:
@@ -8,9 +8,10 @@ from __future__ import annotations
 
 import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from threading import Lock
-from typing import Any
+from typing import Any, Sequence
 
 
 @dataclass
@@ -46,7 +47,7 @@ class StatementResult:
     created_on: int = field(default_factory=lambda: int(time.time() * 1000))
 
     # Result data (populated on success)
-    result_data: list[list[Any]] | None = None
+    result_data: list[Sequence[Any]] | None = None
     result_meta: dict[str, Any] | None = None
     num_rows: int = 0
 
@@ -67,7 +68,7 @@ class StatementResult:
             return 0
         return (len(self.result_data) + self.partition_size - 1) // self.partition_size
 
-    def get_partition(self, partition: int) -> list[list[Any]]:
+    def get_partition(self, partition: int) -> list[Sequence[Any]]:
         """Get data for a specific partition.
 
         Args:
@@ -99,8 +100,8 @@ class StatementManager:
         Args:
             max_statements: Maximum number of statements to store before eviction
         """
-        self._statements: dict[str, StatementResult] = {}
-        self._order: list[str] = []
+        # Insertion ordered, so the oldest statement is always first
+        self._statements: OrderedDict[str, StatementResult] = OrderedDict()
         self._max_statements = max_statements
         self._lock = Lock()
 
@@ -136,13 +137,7 @@ class StatementManager:
         )
 
         with self._lock:
-            # Evict oldest if at capacity
-            while len(self._statements) >= self._max_statements and self._order:
-                oldest = self._order.pop(0)
-                self._statements.pop(oldest, None)
-
-            self._statements[handle] = stmt
-            self._order.append(handle)
+            self._append(stmt)
 
         return stmt
 
@@ -165,7 +160,33 @@ class StatementManager:
             stmt: Statement to update
         """
         with self._lock:
-            self._statements[stmt.handle] = stmt
+            # A statement evicted while it ran stays evicted; re-adding it
+            # here would put an old created_on at the most recent end
+            if stmt.handle in self._statements:
+                self._statements[stmt.handle] = stmt
+
+    def restart_statement(self, stmt: StatementResult) -> None:
+        """Re-stamp a statement that is run again as the most recent one.
+
+        Args:
+            stmt: Statement being re-executed
+        """
+        with self._lock:
+            stmt.created_on = int(time.time() * 1000)
+            self._statements.pop(stmt.handle, None)
+            self._append(stmt)
+
+    def _append(self, stmt: StatementResult) -> None:
+        """Add a statement as the most recent one, evicting the oldest ones
+        at capacity. Must be called with the lock held.
+
+        Args:
+            stmt: Statement to add
+        """
+        while self._statements and len(self._statements) >= self._max_statements:
+            self._statements.popitem(last=False)
+
+        self._statements[stmt.handle] = stmt
 
     def cancel_statement(self, handle: str) -> bool:
         """Cancel a statement.
@@ -197,16 +218,21 @@ class StatementManager:
         Returns:
             List of matching statements, most recent first
         """
-        with self._lock:
-            statements = list(self._statements.values())
+        statements: list[StatementResult] = []
+        if limit <= 0:
+            return statements
 
-        if status:
-            statements = [s for s in statements if s.status == status]
-
-        # Sort by created_on descending
-        statements.sort(key=lambda s: s.created_on, reverse=True)
-
-        return statements[:limit]
+        with self._lock:
+            # Statements are kept in created_on order, so walking them
+            # backwards yields the most recent first and can stop at limit
+            for stmt in reversed(self._statements.values()):
+                if status and stmt.status != status:
+                    continue
+                statements.append(stmt)
+                if len(statements) >= limit:
+                    break
+
+        return statements
 
 
 # Global statement manager instance
@@ -6,7 +6,7 @@ proper result metadata generation.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Sequence
 
 # Mapping from DuckDB/Python types to Snowflake types
 TYPE_MAP = {
@@ -154,14 +154,32 @@ def format_value(value: Any, nullable: bool = True) -> Any:
     return str(value)
 
 
-def format_row(row: list[Any], nullable: bool = True) -> list[Any]:
+def format_row(row: Sequence[Any], nullable: bool = True) -> list[Any]:
     """Format a row's values for JSON response.
 
     Args:
-        row: List of values
+        row: Sequence of values
         nullable: If False, return "null" string instead of None
 
     Returns:
         Formatted row values
     """
-    return [format_value(v, nullable) for v in row]
+    null = None if nullable else "null"
+    return [null if v is None else str(v) for v in row]
+
+
+def format_rows(rows: Sequence[Sequence[Any]], nullable: bool = True) -> list[Any]:
+    """Format many rows' values for JSON response.
+
+    Equivalent to calling format_row on each row, with the value
+    formatting inlined so no function is called per cell.
+
+    Args:
+        rows: Sequence of rows
+        nullable: If False, return "null" string instead of None
+
+    Returns:
+        Formatted rows
+    """
+    null = None if nullable else "null"
+    return [[null if v is None else str(v) for v in row] for row in rows]
@@ -10,7 +10,6 @@ This module contains handler functions organized by responsibility:
 from __future__ import annotations
 
 import datetime
-import gzip
 import io
 import json
 import os
@@ -19,6 +18,8 @@ from typing import TYPE_CHECKING, Any
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 
+from ..serializers import decompress_gzip
+from ..shared import ServerError
 from .auth import generate_scoped_token, parse_form_urlencoded, store_scoped_token
 from .channel_manager import ChannelManager
 
@@ -539,12 +540,16 @@ async def send_telemetry(request: Request) -> JSONResponse:
 
 async def _decompress_body(request: Request) -> bytes:
     """Decompress request body based on Content-Encoding header."""
-    body = await request.body()
     encoding = request.headers.get("Content-Encoding", "")
 
     if encoding == "gzip":
-        return gzip.decompress(body)
-    elif encoding == "zstd":
+        try:
+            return await decompress_gzip(request.stream())
+        except ValueError as e:
+            raise ServerError(status_code=400, code="400001", message=str(e)) from None
+
+    body = await request.body()
+    if encoding == "zstd":
         try:
             import zstandard as zstd
 
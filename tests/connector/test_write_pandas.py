@@ -1,4 +1,6 @@
+import duckdb
 import pandas as pd
+import pytest
 import snowflake.connector
 import snowflake.connector.pandas_tools as pandas_tools
 
@@ -28,3 +30,122 @@ def test_write_pandas_inserts_rows():
 
         cur.execute("SELECT count(*) FROM db.schema.test_pandas")
         assert cur.fetchone()[0] == 2
+
+
+def test_write_pandas_inserts_subset_of_columns():
+    df = pd.DataFrame({"b": ["x", "y"], "a": [1, 2]})
+
+    with patch_snowflake():
+        conn = snowflake.connector.connect(database="db", schema="schema")
+        cur = conn.cursor()
+        cur.execute(
+            "CREATE TABLE db.schema.test_subset (a INTEGER, b VARCHAR, c INTEGER)"
+        )
+
+        success, _, nrows, _ = pandas_tools.write_pandas(
+            conn,
+            df,
+            "test_subset",
+            database="db",
+            schema="schema",
+        )
+
+        assert success is True
+        assert nrows == 2
+
+        cur.execute("SELECT a, b, c FROM db.schema.test_subset ORDER BY a")
+        assert cur.fetchall() == [(1, "x", None), (2, "y", None)]
+
+
+def test_write_pandas_inserts_in_chunks():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+    with patch_snowflake():
+        conn = snowflake.connector.connect(database="db", schema="schema")
+        cur = conn.cursor()
+        cur.execute("CREATE TABLE db.schema.test_chunks (a INTEGER, b VARCHAR)")
+
+        success, nchunks, nrows, _ = pandas_tools.write_pandas(
+            conn,
+            df,
+            "test_chunks",
+            database="db",
+            schema="schema",
+            chunk_size=2,
+        )
+
+        assert success is True
+        assert nchunks == 2
+        assert nrows == 3
+
+        cur.execute("SELECT a, b FROM db.schema.test_chunks ORDER BY a")
+        assert cur.fetchall() == [(1, "x"), (2, "y"), (3, "z")]
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_write_pandas_rejects_non_positive_chunk_size(chunk_size):
+    df = pd.DataFrame({"a": [1, 2]})
+
+    with patch_snowflake():
+        conn = snowflake.connector.connect(database="db", schema="schema")
+        cur = conn.cursor()
+        cur.execute("CREATE TABLE db.schema.test_chunk_size (a INTEGER)")
+
+        with pytest.raises(ValueError, match="chunk_size must be a positive"):
+            pandas_tools.write_pandas(
+                conn,
+                df,
+                "test_chunk_size",
+                database="db",
+                schema="schema",
+                chunk_size=chunk_size,
+            )
+
+        cur.execute("SELECT count(*) FROM db.schema.test_chunk_size")
+        assert cur.fetchone()[0] == 0
+
+
+def test_write_pandas_inserts_mixed_object_column():
+    df = pd.DataFrame({"a": [1, 2], "b": pd.Series([1, "x"], dtype=object)})
+
+    with patch_snowflake():
+        conn = snowflake.connector.connect(database="db", schema="schema")
+        cur = conn.cursor()
+        cur.execute(
+            "CREATE TABLE db.schema.test_mixed (a INTEGER, b VARCHAR, c INTEGER)"
+        )
+
+        result = pandas_tools.write_pandas(
+            conn,
+            df,
+            "test_mixed",
+            database="db",
+            schema="schema",
+        )
+
+        assert result == (True, 1, 2, [])
+
+        cur.execute("SELECT a, b, c FROM db.schema.test_mixed ORDER BY a")
+        assert cur.fetchall() == [(1, "1", None), (2, "x", None)]
+
+
+def test_write_pandas_rolls_back_all_chunks_on_failure():
+    df = pd.DataFrame({"a": [1, 2, None]})
+
+    with patch_snowflake():
+        conn = snowflake.connector.connect(database="db", schema="schema")
+        cur = conn.cursor()
+        cur.execute("CREATE TABLE db.schema.test_rollback (a INTEGER NOT NULL)")
+
+        with pytest.raises(duckdb.ConstraintException):
+            pandas_tools.write_pandas(
+                conn,
+                df,
+                "test_rollback",
+                database="db",
+                schema="schema",
+                chunk_size=2,
+            )
+
+        cur.execute("SELECT count(*) FROM db.schema.test_rollback")
+        assert cur.fetchone()[0] == 0
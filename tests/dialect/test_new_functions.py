@@ -39,6 +39,13 @@ def test_soundex(conn):
         assert res[0] == "R163"  # Standard Soundex code
 
 
+def test_soundex_consonant_groups(conn):
+    """Test SOUNDEX maps each consonant group to its digit."""
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT SOUNDEX('Ashcraft'), SOUNDEX('Mendel')")
+        assert cursor.fetchone() == ("A261", "M534")
+
+
 def test_reverse(dialect_context):
     """Test REVERSE reverses string."""
     sql = "SELECT REVERSE('hello')"
@@ -1,6 +1,14 @@
-from sqlglot import parse_one
+import pytest
+from sqlglot import exp, parse_one
 
-from snowduck.dialect.preprocess import preprocess_current_schema, preprocess_identifier
+from snowduck.dialect.preprocess import (
+    preprocess_current_schema,
+    preprocess_fused,
+    preprocess_identifier,
+    preprocess_info_schema,
+    preprocess_semi_structured,
+    preprocess_system_calls,
+)
 
 
 def test_identifier(dialect_context):
@@ -21,3 +29,48 @@ def test_current_schema(dialect_context):
         preprocess_current_schema, context=dialect_context
     ).sql()
     assert transformed_sql == "SELECT 'test_schema' AS current_schema"
+
+
+def test_info_schema_databases_in_current_schema(dialect_context):
+    """DATABASES resolves via the current schema, whatever its case."""
+    dialect_context.current_schema = "information_schema"
+    expression = parse_one("SELECT * FROM databases", read="snowflake")
+    transformed = expression.transform(preprocess_info_schema, context=dialect_context)
+    assert transformed.find(exp.Table).name == "_DATABASES"
+
+    dialect_context.current_schema = "test_schema"
+    expression = parse_one("SELECT * FROM databases", read="snowflake")
+    transformed = expression.transform(preprocess_info_schema, context=dialect_context)
+    assert transformed.find(exp.Table).name == "databases"
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT * FROM IDENTIFIER('foo')",
+        "SELECT * FROM IDENTIFIER('databases')",
+        "SELECT * FROM information_schema.databases",
+        "SELECT CURRENT_SCHEMA(), PARSE_JSON('{}')",
+        "SELECT GET_PATH(PARSE_JSON(v), 'a.b'), OBJECT_CONSTRUCT('k', CURRENT_SCHEMA())",
+        "SELECT ARRAY_SLICE(ARRAY_CONSTRUCT(1, 2, 3), 0, IDENTIFIER('n')) FROM t",
+        "SELECT v:a.b[0] FROM t AT(OFFSET => -60)",
+        "CREATE TABLE t (a ARRAY, v VARIANT, o OBJECT)",
+    ],
+)
+def test_fused_matches_separate_passes(dialect_context, sql):
+    """The fused walk produces the same tree as the individual passes."""
+    dialect_context.current_schema = "information_schema"
+    expression = parse_one(sql, read="snowflake")
+
+    expected = expression
+    for preprocess in (
+        preprocess_identifier,
+        preprocess_info_schema,
+        preprocess_current_schema,
+        preprocess_system_calls,
+        preprocess_semi_structured,
+    ):
+        expected = expected.transform(preprocess, context=dialect_context)
+
+    fused = expression.transform(preprocess_fused, context=dialect_context)
+    assert fused.sql(dialect="duckdb") == expected.sql(dialect="duckdb")
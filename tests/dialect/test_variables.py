@@ -120,3 +120,35 @@ def test_variable_isolation_between_sessions():
     # Should not be visible in session 2
     with pytest.raises((ValueError, Exception), match=".*variable.*"):
         cur2.execute("SELECT $session_var")
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("42", "42"),
+        ("-7", "-7"),
+        ("+5", "5"),
+        ("1.5", "1.5"),
+        ("1e3", "1000.0"),
+        ("hello", "'hello'"),
+        ("--5", "'--5'"),
+    ],
+)
+def test_coerce_variable_literal(value, expected):
+    """SET values are coerced to int, float or string literals."""
+    from snowduck.dialect.preprocess.variables import coerce_variable_literal
+
+    assert coerce_variable_literal(value).sql() == expected
+
+
+@mock_snowflake
+def test_variable_reused_across_statements():
+    """A stored variable can be substituted any number of times."""
+    conn = snowflake.connector.connect()
+    cur = conn.cursor()
+
+    cur.execute("SET n = 3")
+    cur.execute("SELECT $n + $n")
+    assert cur.fetchone()[0] == 6
+    cur.execute("SELECT $n * 2")
+    assert cur.fetchone()[0] == 6
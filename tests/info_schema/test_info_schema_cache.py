@@ -12,3 +12,28 @@ def test_info_schema_cache_reuse():
     second = mgr.get_table_columns(database="memory", schema="main", table="test_cache")
 
     assert first == second
+
+
+def test_database_existence_cache():
+    conn = duckdb.connect(":memory:")
+    mgr = InfoSchemaManager(conn)
+
+    # Misses are not cached
+    assert not mgr.has_database("other")
+    conn.execute("ATTACH ':memory:' AS other")
+    assert mgr.has_database("other")
+
+    # Hits are cached until the cache is cleared
+    conn.execute("DETACH other")
+    assert mgr.has_database("OTHER")
+    mgr.clear_cache()
+    assert not mgr.has_database("other")
+
+
+def test_column_metadata_refreshes_after_ddl(conn):
+    with conn.cursor() as cur:
+        cur.execute("CREATE TABLE cached_cols (a INTEGER)")
+        assert list(conn.get_column_metadata_map("cached_cols")) == ["a"]
+
+        cur.execute("ALTER TABLE cached_cols ADD COLUMN b VARCHAR")
+        assert list(conn.get_column_metadata_map("cached_cols")) == ["a", "b"]
@@ -1,3 +1,4 @@
+import os
 from unittest.mock import mock_open, patch
 
 import pytest
@@ -29,6 +30,16 @@ def test_load_sql_unsafe_characters():
             load_sql("query.sql", table="users; DROP TABLE users;")
 
 
+def test_load_sql_rereads_modified_file(tmp_path):
+    path = tmp_path / "query.sql"
+    path.write_text("SELECT * FROM {table}")
+    assert load_sql(str(path), table="users") == "SELECT * FROM users"
+
+    path.write_text("SELECT 1 FROM {table}")
+    os.utime(path, (0, 1_000_000))
+    assert load_sql(str(path), table="users") == "SELECT 1 FROM users"
+
+
 def test_attach_account_database(in_memory_duckdb_connection):
     info_schema_manager = InfoSchemaManager(in_memory_duckdb_connection)
     result = in_memory_duckdb_connection.execute("SHOW DATABASES").fetchall()
@@ -0,0 +1,81 @@
+from datetime import datetime, timezone
+
+import pyarrow as pa
+
+from snowduck.server.arrow import timestamp_to_sf_struct, to_ipc, to_sf
+
+
+def test_timestamp_to_sf_struct_splits_epoch_and_fraction():
+    ts = pa.array(
+        [datetime(2024, 1, 2, 3, 4, 5, 250000), None], type=pa.timestamp("us")
+    )
+
+    result = timestamp_to_sf_struct(ts)
+
+    assert [field.name for field in result.type] == ["epoch", "fraction"]
+    assert result.field("epoch").to_pylist()[0] == 1704164645
+    assert result.field("fraction").to_pylist()[0] == 250_000_000
+
+
+def test_timestamp_to_sf_struct_keeps_chunks():
+    ts_type = pa.timestamp("us", tz="UTC")
+    ts = pa.chunked_array(
+        [
+            pa.array([datetime(2024, 1, 1, tzinfo=timezone.utc)], type=ts_type),
+            pa.array([datetime(2024, 1, 2, tzinfo=timezone.utc)], type=ts_type),
+        ]
+    )
+
+    result = timestamp_to_sf_struct(ts)
+
+    assert isinstance(result, pa.ChunkedArray)
+    assert result.num_chunks == 2
+    assert result.to_pylist() == [
+        {"epoch": 1704067200, "fraction": 0, "timezone": 1440},
+        {"epoch": 1704153600, "fraction": 0, "timezone": 1440},
+    ]
+
+
+def test_timestamp_to_sf_struct_exact_fraction_for_any_unit():
+    values = [1_704_164_645_522_747_001, -1_500_000_000]
+    ts = pa.array(values, type=pa.int64()).cast(pa.timestamp("ns"))
+
+    result = timestamp_to_sf_struct(ts)
+
+    assert result.to_pylist() == [
+        {"epoch": 1704164645, "fraction": 522_747_001},
+        {"epoch": -2, "fraction": 500_000_000},
+    ]
+
+    us = timestamp_to_sf_struct(ts.cast(pa.timestamp("us"), safe=False))
+    assert us.field("fraction").to_pylist() == [522_747_000, 500_000_000]
+
+
+def test_to_ipc_writes_every_batch():
+    table = pa.Table.from_batches(
+        [
+            pa.record_batch({"a": pa.array([1, 2])}),
+            pa.record_batch({"a": pa.array([3])}),
+        ]
+    )
+
+    reader = pa.ipc.open_stream(to_ipc(table))
+
+    assert reader.read_all().column("a").to_pylist() == [1, 2, 3]
+
+
+def test_to_sf_converts_only_temporal_columns():
+    table = pa.table(
+        {
+            "id": pa.array([1], type=pa.int64()),
+            "at": pa.array([3_000_000], type=pa.time64("us")),
+        }
+    )
+    column = {"precision": None, "scale": None, "length": None}
+    rowtype = [{**column, "type": "fixed"}, {**column, "type": "time"}]
+
+    result = to_sf(table, rowtype)
+
+    assert result.column("id").to_pylist() == [1]
+    assert result.column("at").to_pylist() == [3_000_000_000]
+    assert result.schema.field("at").metadata[b"logicalType"] == b"TIME"
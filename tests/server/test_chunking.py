@@ -1,3 +1,6 @@
+import gzip
+import json
+
 from starlette.testclient import TestClient
 
 from snowduck.server import app
@@ -33,3 +36,86 @@ def test_query_chunking(monkeypatch):
         assert data["chunks"][1]["rowset"] == [[4]]
 
     monkeypatch.delenv("SNOWDUCK_CHUNK_SIZE", raising=False)
+
+
+def test_query_chunking_by_byte_budget(monkeypatch):
+    monkeypatch.setenv("SNOWDUCK_CHUNK_SIZE", "1000")
+    monkeypatch.setenv("SNOWDUCK_CHUNK_BYTES", "20")
+
+    with TestClient(app) as client:
+        login_resp = client.post(
+            "/session/v1/login-request?databaseName=db&schemaName=schema",
+            json={},
+        )
+        token = login_resp.json()["data"]["token"]
+
+        headers = {"Authorization": f'Snowflake Token="{token}"'}
+        query_resp = client.post(
+            "/queries/v1/query-request",
+            headers=headers,
+            json={"sqlText": "SELECT * FROM range(5)", "queryResultFormat": "json"},
+        )
+
+        data = query_resp.json()["data"]
+
+        # range() yields 8-byte BIGINTs plus a validity bitmap, so a 20 byte
+        # budget fits two rows
+        assert data["total"] == 5
+        assert data["rowset"] == [[0], [1]]
+        assert [chunk["chunkIndex"] for chunk in data["chunks"]] == [1, 2]
+        assert data["chunks"][1]["rowset"] == [[4]]
+
+
+def test_large_query_response_is_gzip_compressed():
+    with TestClient(app) as client:
+        login_resp = client.post(
+            "/session/v1/login-request?databaseName=db&schemaName=schema",
+            json={},
+        )
+        token = login_resp.json()["data"]["token"]
+
+        headers = {
+            "Authorization": f'Snowflake Token="{token}"',
+            "Accept-Encoding": "gzip",
+        }
+        query_resp = client.post(
+            "/queries/v1/query-request",
+            headers=headers,
+            json={"sqlText": "SELECT * FROM range(500)", "queryResultFormat": "json"},
+        )
+
+        assert query_resp.headers["content-encoding"] == "gzip"
+        assert query_resp.json()["data"]["total"] == 500
+
+
+def test_gzip_request_body_with_several_members():
+    with TestClient(app) as client:
+        login_resp = client.post(
+            "/session/v1/login-request?databaseName=db&schemaName=schema",
+            json={},
+        )
+        token = login_resp.json()["data"]["token"]
+
+        headers = {
+            "Authorization": f'Snowflake Token="{token}"',
+            "Content-Encoding": "gzip",
+            "Content-Type": "application/json",
+        }
+        body = json.dumps(
+            {"sqlText": "SELECT 42", "queryResultFormat": "json"}
+        ).encode()
+        half = len(body) // 2
+        query_resp = client.post(
+            "/queries/v1/query-request",
+            headers=headers,
+            content=gzip.compress(body[:half]) + gzip.compress(body[half:]),
+        )
+        assert query_resp.status_code == 200
+        assert query_resp.json()["data"]["rowset"] == [[42]]
+
+        truncated_resp = client.post(
+            "/queries/v1/query-request",
+            headers=headers,
+            content=gzip.compress(body)[:-8],
+        )
+        assert truncated_resp.status_code == 400
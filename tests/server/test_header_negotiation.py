@@ -1,3 +1,4 @@
+import pyarrow as pa
 from starlette.testclient import TestClient
 
 from snowduck.server import app
@@ -25,3 +26,59 @@ def test_query_format_inferred_from_accept_header():
         assert query_resp.status_code == 200
         data = query_resp.json()["data"]
         assert data["queryResultFormat"] == "json"
+
+
+def test_query_streams_arrow_ipc_when_accepted():
+    with TestClient(app) as client:
+        login_resp = client.post(
+            "/session/v1/login-request?databaseName=db&schemaName=schema",
+            json={},
+        )
+        token = login_resp.json()["data"]["token"]
+
+        headers = {
+            "Authorization": f'Snowflake Token="{token}"',
+            "Accept": "application/vnd.apache.arrow.stream",
+        }
+
+        query_resp = client.post(
+            "/queries/v1/query-request",
+            headers=headers,
+            json={"sqlText": "SELECT range AS n FROM range(5)"},
+        )
+
+        assert query_resp.status_code == 200
+        assert query_resp.headers["content-type"].startswith(
+            "application/vnd.apache.arrow.stream"
+        )
+        table = pa.ipc.open_stream(query_resp.content).read_all()
+        assert table.num_rows == 5
+        assert table.column(0).to_pylist() == [0, 1, 2, 3, 4]
+
+
+def test_query_streams_arrow_ipc_for_empty_result():
+    with TestClient(app) as client:
+        login_resp = client.post(
+            "/session/v1/login-request?databaseName=db&schemaName=schema",
+            json={},
+        )
+        token = login_resp.json()["data"]["token"]
+
+        headers = {
+            "Authorization": f'Snowflake Token="{token}"',
+            "Accept": "application/vnd.apache.arrow.stream",
+        }
+
+        query_resp = client.post(
+            "/queries/v1/query-request",
+            headers=headers,
+            json={"sqlText": "SELECT range AS n FROM range(5) WHERE range > 10"},
+        )
+
+        assert query_resp.status_code == 200
+        assert query_resp.headers["content-type"].startswith(
+            "application/vnd.apache.arrow.stream"
+        )
+        table = pa.ipc.open_stream(query_resp.content).read_all()
+        assert table.num_rows == 0
+        assert table.column_names == ["n"]
@@ -0,0 +1,40 @@
+import pytest
+from starlette.testclient import TestClient
+
+from snowduck.server import app
+
+
+@pytest.mark.parametrize(
+    "authorization",
+    [
+        "Snowflake Token=missing",
+        'Bearer "token"',
+        'Snowflake Token="unknown"',
+    ],
+)
+def test_invalid_authorization_is_rejected(authorization):
+    with TestClient(app) as client:
+        resp = client.post(
+            "/queries/v1/query-request",
+            headers={"Authorization": authorization},
+            json={"sqlText": "SELECT 1"},
+        )
+
+        assert resp.status_code == 401
+        assert resp.json()["code"] == "390104"
+
+
+def test_valid_token_is_accepted():
+    with TestClient(app) as client:
+        login_resp = client.post(
+            "/session/v1/login-request?databaseName=db&schemaName=schema",
+            json={},
+        )
+        token = login_resp.json()["data"]["token"]
+
+        resp = client.post(
+            "/session/heartbeat-request",
+            headers={"Authorization": f'Snowflake Token="{token}"'},
+        )
+
+        assert resp.status_code == 200
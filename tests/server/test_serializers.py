@@ -0,0 +1,61 @@
+import asyncio
+import gzip
+from datetime import date, datetime
+from decimal import Decimal
+
+import pyarrow as pa
+import pytest
+
+from snowduck.server.serializers import (
+    decompress_gzip,
+    serialize_arrow_rowset,
+    serialize_rowset,
+)
+
+
+def _decompress_in_chunks(body: bytes, size: int) -> bytes:
+    async def chunks():
+        for start in range(0, len(body), size):
+            yield body[start : start + size]
+
+    return asyncio.run(decompress_gzip(chunks()))
+
+
+def test_serialize_arrow_rowset_matches_row_serialization():
+    table = pa.table(
+        {
+            "i": pa.array([1, None], type=pa.int64()),
+            "d": pa.array(
+                [Decimal("1.50"), Decimal("-0.50")], type=pa.decimal128(12, 2)
+            ),
+            "dt": pa.array([date(2024, 1, 2), None]),
+            "ts": pa.array([datetime(2024, 1, 2, 3, 4, 5, 500000), None]),
+            "b": pa.array([b"\xaa\x01", None]),
+            "s": pa.array(["x", None]),
+            "l": pa.array([[1, 2], None]),
+        }
+    )
+
+    rows = [tuple(row.values()) for row in table.to_pylist()]
+
+    assert serialize_arrow_rowset(table) == serialize_rowset(rows)
+    assert serialize_arrow_rowset(table)[0][:3] == [1, "1.50", "2024-01-02"]
+
+
+@pytest.mark.parametrize("size", [1, 7, 1024])
+def test_decompress_gzip_reads_every_member(size):
+    body = gzip.compress(b"abc") + gzip.compress(b"def")
+
+    assert _decompress_in_chunks(body, size) == b"abcdef"
+
+
+def test_decompress_gzip_rejects_truncated_data():
+    body = gzip.compress(b"abcdef" * 100)
+
+    with pytest.raises(ValueError, match="Truncated"):
+        _decompress_in_chunks(body[:-8], 16)
+
+
+def test_decompress_gzip_rejects_corrupt_data():
+    with pytest.raises(ValueError, match="Invalid gzip data"):
+        _decompress_in_chunks(b"not gzip", 16)
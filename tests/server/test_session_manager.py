@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from snowduck.server import SessionManager
@@ -65,3 +67,48 @@ def test_session_exists(session_manager, mock_connection):
     assert session_manager.session_exists(token)
     session_manager.delete_session(token)
     assert not session_manager.session_exists(token)
+
+
+def test_get_or_none(session_manager, mock_connection):
+    """Test looking up the connection and lock of a session at once."""
+    token = "test_token"
+    assert session_manager.get_or_none(token) is None
+    session_manager.create_session(token, mock_connection)
+    session = session_manager.get_or_none(token)
+    assert session.connection is mock_connection
+    assert session.lock is session_manager.get_lock(token)
+
+
+def test_least_recently_used_session_is_evicted(mock_connection):
+    """Test that sessions beyond capacity are evicted oldest first."""
+    manager = SessionManager(max_sessions=2)
+    manager.create_session("a", mock_connection)
+    manager.create_session("b", mock_connection)
+    # Using 'a' makes 'b' the least recently used session
+    manager.get_or_none("a")
+    manager.create_session("c", mock_connection)
+    assert manager.session_exists("a")
+    assert not manager.session_exists("b")
+    assert manager.session_exists("c")
+
+
+def test_idle_session_is_evicted(mock_connection):
+    """Test that sessions idle past the timeout are dropped."""
+    manager = SessionManager(idle_timeout=0)
+    manager.create_session("a", mock_connection)
+    manager.get_or_none("a").last_used -= 1
+    manager.create_session("b", mock_connection)
+    assert not manager.session_exists("a")
+    assert manager.session_exists("b")
+
+
+def test_busy_session_does_not_block_eviction(mock_connection):
+    """Test that a session running a query is skipped, not a stopping point."""
+    manager = SessionManager(max_sessions=2)
+    manager.create_session("busy", mock_connection)
+    manager.create_session("idle", mock_connection)
+    asyncio.run(manager.get_lock("busy").acquire())
+    manager.create_session("new", mock_connection)
+    assert manager.session_exists("busy")
+    assert not manager.session_exists("idle")
+    assert manager.session_exists("new")
@@ -0,0 +1,30 @@
+from starlette.testclient import TestClient
+
+from snowduck.server import app
+
+
+def test_set_session_parameters_reports_status_per_parameter():
+    with TestClient(app) as client:
+        login_resp = client.post(
+            "/session/v1/login-request?databaseName=db&schemaName=schema",
+            json={},
+        )
+        token = login_resp.json()["data"]["token"]
+        headers = {"Authorization": f'Snowflake Token="{token}"'}
+
+        resp = client.post(
+            "/session/parameters",
+            headers=headers,
+            json={
+                "parameters": [
+                    {"name": "timezone", "value": "UTC"},
+                    {"name": "USE_SCHEMA", "value": "PUBLIC"},
+                    {"name": "USE_SCHEMA", "value": "NOT A SCHEMA"},
+                    {"name": "UNKNOWN", "value": 1},
+                ]
+            },
+        )
+
+        assert resp.status_code == 200
+        statuses = [p["status"] for p in resp.json()["data"]["parameters"]]
+        assert statuses == ["accepted", "applied", "error", "ignored"]
@@ -184,6 +184,18 @@ class TestSQLAPI:
         assert data["resultSetMetaData"]["numRows"] == 3
         assert len(data["data"]) == 3
 
+    def test_rows_streamed_across_batches(self, test_client) -> None:
+        """Test that rows encoded in several batches form one data array."""
+        response = test_client.post(
+            "/api/v2/statements",
+            json={"statement": "SELECT range AS n FROM range(2500)"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["code"] == "090001"
+        assert [row[0] for row in data["data"]] == [str(n) for n in range(2500)]
+
     def test_ddl_statement(self, test_client) -> None:
         """Test DDL statement execution."""
         # Create table
@@ -465,3 +477,79 @@ class TestSQLAPI:
         # All returned queries should have success status
         for query in data["queries"]:
             assert query["status"] == "success"
+
+
+class TestStatementManager:
+    """Unit tests for StatementManager."""
+
+    def test_oldest_statement_is_evicted(self) -> None:
+        """Test that creating past capacity evicts the oldest statement."""
+        from snowduck.server.sql_api import StatementManager
+
+        manager = StatementManager(max_statements=2)
+        first = manager.create_statement("SELECT 1")
+        second = manager.create_statement("SELECT 2")
+        third = manager.create_statement("SELECT 3")
+
+        assert manager.get_statement(first.handle) is None
+        assert manager.get_statement(second.handle) is second
+        assert manager.get_statement(third.handle) is third
+
+    def test_list_statements_most_recent_first(self) -> None:
+        """Test that listing returns the newest statements, restarted ones first."""
+        from snowduck.server.sql_api import StatementManager
+
+        manager = StatementManager()
+        first = manager.create_statement("SELECT 1")
+        second = manager.create_statement("SELECT 2")
+        second.status = "failed"
+        manager.update_statement(second)
+        third = manager.create_statement("SELECT 3")
+
+        assert manager.list_statements(limit=2) == [third, second]
+        assert manager.list_statements(status="failed") == [second]
+
+        manager.restart_statement(first)
+        assert manager.list_statements() == [first, third, second]
+
+    def test_evicted_statement_is_not_re_added(self) -> None:
+        """Test that updating a statement evicted mid-execution leaves it out."""
+        from snowduck.server.sql_api import StatementManager
+
+        manager = StatementManager(max_statements=1)
+        first = manager.create_statement("SELECT 1")
+        second = manager.create_statement("SELECT 2")
+        first.status = "success"
+        manager.update_statement(first)
+
+        assert manager.get_statement(first.handle) is None
+        assert manager.list_statements() == [second]
+
+    def test_restart_statement_respects_capacity(self) -> None:
+        """Test that restarting an evicted statement evicts the oldest one."""
+        from snowduck.server.sql_api import StatementManager
+
+        manager = StatementManager(max_statements=2)
+        first = manager.create_statement("SELECT 1")
+        second = manager.create_statement("SELECT 2")
+        third = manager.create_statement("SELECT 3")
+
+        manager.restart_statement(first)
+
+        assert manager.get_statement(second.handle) is None
+        assert manager.list_statements() == [first, third]
+
+
+class TestFormatting:
+    """Unit tests for result value formatting."""
+
+    @pytest.mark.parametrize("nullable", [True, False])
+    def test_format_rows_matches_format_value(self, nullable) -> None:
+        """Test that format_rows formats every cell like format_value."""
+        from snowduck.server.sql_api import format_row, format_rows, format_value
+
+        rows = [(1, "a", None, 1.5, True), (None, None, 0, "", False)]
+
+        expected = [[format_value(v, nullable) for v in row] for row in rows]
+        assert format_rows(rows, nullable) == expected
+        assert [format_row(row, nullable) for row in rows] == expected
@@ -1,5 +1,8 @@
 """Tests for Snowpipe Streaming REST API."""
 
+import gzip
+import json
+
 import pytest
 
 from snowduck.server.streaming import ChannelManager, ChannelStatus
@@ -437,6 +440,49 @@ class TestStreamingEndpoints:
         assert "CH2" in data["channel_statuses"]
         assert "NONEXISTENT" not in data["channel_statuses"]
 
+    def test_bulk_channel_status_gzip_body(self, client: "TestClient") -> None:
+        client.put(
+            "/v2/streaming/databases/testdb/schemas/testschema/pipes/gzpipe/channels/ch1"
+        )
+
+        response = client.post(
+            "/v2/streaming/databases/testdb/schemas/testschema/pipes/gzpipe:bulk-channel-status",
+            content=gzip.compress(json.dumps({"channel_names": ["CH1"]}).encode()),
+            headers={"Content-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert "CH1" in response.json()["channel_statuses"]
+
+    def test_bulk_channel_status_multi_member_gzip_body(
+        self, client: "TestClient"
+    ) -> None:
+        client.put(
+            "/v2/streaming/databases/testdb/schemas/testschema/pipes/gzpipe/channels/ch1"
+        )
+
+        body = json.dumps({"channel_names": ["CH1"]}).encode()
+        response = client.post(
+            "/v2/streaming/databases/testdb/schemas/testschema/pipes/gzpipe:bulk-channel-status",
+            content=gzip.compress(body[:10]) + gzip.compress(body[10:]),
+            headers={"Content-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert "CH1" in response.json()["channel_statuses"]
+
+    def test_bulk_channel_status_truncated_gzip_body(
+        self, client: "TestClient"
+    ) -> None:
+        body = json.dumps({"channel_names": ["CH1"]}).encode()
+        response = client.post(
+            "/v2/streaming/databases/testdb/schemas/testschema/pipes/gzpipe:bulk-channel-status",
+            content=gzip.compress(body)[:-8],
+            headers={"Content-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 400
+
     def test_append_rows_without_continuation_token(self, client: "TestClient") -> None:
         # Create channel first
         client.put(
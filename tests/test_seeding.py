@@ -141,3 +141,52 @@ def test_seed_table_empty_data_raises():
 
         with pytest.raises(ValueError, match="empty data"):
             seed_table(conn, "test", pd.DataFrame())
+
+
+def test_seed_table_handles_float_and_boolean_columns():
+    """Test that float and boolean columns round-trip with NULLs."""
+    with patch_snowflake():
+        import snowflake.connector
+
+        conn = snowflake.connector.connect()
+
+        df = pd.DataFrame(
+            {
+                "id": [1, 2],
+                "ratio": [1.5, None],
+                "active": [True, False],
+            }
+        )
+
+        seed_table(conn, "flags", df)
+
+        cursor = conn.cursor()
+        cursor.execute("SELECT id, ratio, active FROM flags ORDER BY id")
+        assert cursor.fetchall() == [(1, 1.5, True), (2, None, False)]
+
+
+def test_seed_table_keeps_literal_typing_of_numeric_rows():
+    """Test that int columns next to float columns seed as DECIMAL, as
+    float literals, unless a non-numeric column keeps them integers."""
+    from decimal import Decimal
+
+    with patch_snowflake():
+        import snowflake.connector
+
+        conn = snowflake.connector.connect()
+        cursor = conn.cursor()
+
+        seed_table(conn, "numeric_rows", {"id": [1, 2], "ratio": [1.5, 2.25]})
+        cursor.execute("SELECT id, ratio FROM numeric_rows ORDER BY id")
+        assert cursor.fetchall() == [
+            (Decimal("1.0"), Decimal("1.50")),
+            (Decimal("2.0"), Decimal("2.25")),
+        ]
+        cursor.execute("SELECT TYPEOF(id), TYPEOF(ratio) FROM numeric_rows LIMIT 1")
+        assert cursor.fetchone() == ("DECIMAL(2,1)", "DECIMAL(3,2)")
+
+        seed_table(
+            conn, "mixed_rows", {"id": [1, 2], "ratio": [1.5, 2.25], "name": ["a", "b"]}
+        )
+        cursor.execute("SELECT id FROM mixed_rows ORDER BY id")
+        assert cursor.fetchall() == [(1,), (2,)]